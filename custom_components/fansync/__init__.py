@@ -159,10 +159,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: FanSyncConfigEntry) -> b
                 # device_id identifies the originating device so multi-device setups
                 # do not cross-contaminate each other's state.
                 did = device_id or getattr(client, "device_id", None) or "unknown"
-                current = coordinator.data or {}
-                merged: dict[str, dict[str, object]] = dict(current)
-                merged[did] = status
-                coordinator.async_set_updated_data(merged)
+                coordinator.async_set_device_status(did, status)
                 if _LOGGER.isEnabledFor(logging.DEBUG):
                     keys = list(status.keys()) if isinstance(status, dict) else []
                     _LOGGER.debug("push merge d=%s keys=%s", did, keys)
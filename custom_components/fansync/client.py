@@ -95,6 +95,9 @@ class FanSyncClient:
         self._device_ids: list[str] = []
         self._device_meta: dict[str, dict[str, Any]] = {}
         self._device_profile: dict[str, dict[str, Any]] = {}
+        # Read-only profile copies served by device_profile_cached(); an entry is
+        # dropped whenever that device's profile changes
+        self._profile_cache: dict[str, dict[str, Any]] = {}
         self._status_callback: Callable[[str, dict[str, Any]], None] | None = None
         self._running: bool = False
         self._recv_task: asyncio.Task | None = None
@@ -104,6 +107,8 @@ class FanSyncClient:
         self._last_push_keys: list[str] | None = None
         self._last_push_key_count: int | None = None
         self._last_push_by_device: dict[str, dict[str, Any]] = {}
+        # Monotonic time of the last push per device; lets polling skip only fresh devices
+        self._last_push_monotonic_by_device: dict[str, float] = {}
         self._last_set_by_device: dict[str, dict[str, Any]] = {}
         self._last_get_by_device: dict[str, dict[str, Any]] = {}
         self._last_request_id: int | None = None
@@ -688,6 +693,7 @@ class FanSyncClient:
                     self.metrics.record_push_update()
                     self._push_count += 1
                     self._last_push_monotonic = time.monotonic()
+                    self._last_push_monotonic_by_device[push_device] = self._last_push_monotonic
                     self._last_push_utc = datetime.now(UTC).isoformat()
                     self._last_push_keys = sorted(list(pushed_status.keys()))
                     self._last_push_key_count = len(pushed_status)
@@ -986,6 +992,8 @@ class FanSyncClient:
                 if isinstance(data_obj, dict):
                     prof = data_obj.get("profile")
                     if isinstance(prof, dict):
+                        if self._device_profile.get(did) != prof:
+                            self._profile_cache.pop(did, None)
                         self._device_profile[did] = prof
                         if _LOGGER.isEnabledFor(logging.DEBUG):
                             _LOGGER.debug(
@@ -1085,8 +1093,15 @@ class FanSyncClient:
             )
             raise
 
-    async def async_set(self, data: dict[str, int], *, device_id: str | None = None) -> None:
-        """Set device parameters."""
+    async def async_set(
+        self, data: dict[str, int], *, device_id: str | None = None
+    ) -> dict[str, object] | None:
+        """Set device parameters.
+
+        Entities always pass ``device_id`` by keyword; there is no positional fallback.
+        Returns the device status carried by the acknowledgment, or None if the ack
+        had none, so callers can confirm the change without a follow-up get.
+        """
         t_total = time.monotonic()
         did = device_id or self._device_id
         if not did:
@@ -1146,6 +1161,8 @@ class FanSyncClient:
                 # device that was actually set (not the connection's default device).
                 if self._status_callback is not None:
                     self.hass.loop.call_soon(self._status_callback, did, ack_data["status"])
+                return ack_data["status"]
+            return None
 
         except Exception as exc:
             if isinstance(exc, TimeoutError):
@@ -1231,9 +1248,32 @@ class FanSyncClient:
     def device_profile(self, device_id: str) -> dict[str, Any]:
         return dict(self._device_profile.get(device_id, {}))
 
+    def device_profile_cached(self, device_id: str) -> dict[str, Any]:
+        """Return a device's profile, memoized until a status fetch changes it.
+
+        Unlike device_profile(), repeated calls share one copy; callers must
+        treat it as read-only.
+        """
+        prof = self._profile_cache.get(device_id)
+        if prof is None:
+            prof = self._profile_cache[device_id] = self.device_profile(device_id)
+        return prof
+
+    def device_profiles_snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return all cached device profiles in one call.
+
+        Only the outer mapping is copied; callers must treat profiles as read-only.
+        """
+        return dict(self._device_profile)
+
     def set_status_callback(self, callback: Callable[[str, dict[str, Any]], None]) -> None:
         self._status_callback = callback
 
+    @property
+    def push_enabled(self) -> bool:
+        """Return True when push updates are enabled and the WebSocket is connected."""
+        return bool(self._enable_push and self.metrics.is_connected)
+
     def ws_timeout_seconds(self) -> int:
         """Expose effective WebSocket timeout for coordinators."""
         try:
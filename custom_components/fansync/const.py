@@ -11,6 +11,7 @@
 # limitations under the License.
 
 from collections.abc import Iterable, Mapping
+from types import MappingProxyType
 
 DOMAIN = "fansync"
 PLATFORMS = ["fan", "light"]
@@ -30,6 +31,8 @@ KEY_LIGHT_BRIGHTNESS = "H0C"
 
 # Preset modes mapping
 PRESET_MODES = {0: "normal", 1: "fresh_air"}
+# Read-only reverse lookup (mode name -> protocol value)
+PRESET_MODES_INV: Mapping[str, int] = MappingProxyType({v: k for k, v in PRESET_MODES.items()})
 
 
 # Optimistic update timing (shared by entities)
@@ -37,13 +40,22 @@ PRESET_MODES = {0: "normal", 1: "fresh_air"}
 # Push updates (device_change events) are reliable and typically arrive within 1-2 seconds.
 # Early termination logic stops polling once push confirms, so this is mainly a safety net.
 OPTIMISTIC_GUARD_SEC = 3.0
+# Once push/poll confirmations have been observed, each entity sizes its guard to a
+# multiple of its smoothed confirm latency, capped at OPTIMISTIC_GUARD_SEC. The guard never
+# drops below the confirmation window plus this margin for request round trips.
+OPTIMISTIC_GUARD_MARGIN_SEC = 0.5
+OPTIMISTIC_GUARD_LATENCY_FACTOR = 3.0
+# Weight of the newest sample in the smoothed (EWMA) confirm latency
+CONFIRM_LATENCY_ALPHA = 0.2
 # Confirmation polling attempts and delay between polls
 # Push updates typically confirm changes within 1-2 seconds, terminating polling early.
-# Initial 0.5s delay before first poll, then 2 poll attempts with 0.5s delays between
-# (total up to 1.5s). Push updates typically confirm within the initial delay, avoiding
-# polling entirely.
+# Initial 0.5s delay before first poll, then 2 poll attempts; the delay between polls
+# starts at 0.5s and doubles up to CONFIRM_MAX_DELAY_SEC, with no sleep after the final
+# poll (total up to 1.0s). Push updates typically confirm within the initial delay,
+# avoiding polling entirely.
 CONFIRM_RETRY_ATTEMPTS = 2
 CONFIRM_RETRY_DELAY_SEC = 0.5
+CONFIRM_MAX_DELAY_SEC = 2.0
 CONFIRM_INITIAL_DELAY_SEC = 0.5
 
 # Options: fallback polling
@@ -105,6 +117,8 @@ WS_GREETING_TIMEOUT_SEC = 2.0
 # Coordinator timeouts
 # Align with default WS timeout to avoid cancelling in-progress recv operations
 POLL_STATUS_TIMEOUT_SECS = 30
+# Cap on concurrent per-device status fetches during a coordinator update
+MAX_CONCURRENT_STATUS_FETCHES = 4
 
 # Performance monitoring thresholds
 # Warn users when command latency exceeds these thresholds
@@ -13,14 +13,16 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
 import logging
 import time
+from collections import deque
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import httpx
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.typing import UNDEFINED
@@ -30,15 +32,22 @@ from .client import FanSyncClient
 from .const import (
     DEFAULT_FALLBACK_POLL_SECS,
     DOMAIN,
+    MAX_CONCURRENT_STATUS_FETCHES,
     MISMATCH_HISTORY_MAX,
     POLL_STATUS_TIMEOUT_SECS,
     STATUS_HISTORY_MAX,
 )
-from .device_utils import create_device_info
+from .device_utils import cached_device_profile, create_device_info
 from .diagnostics_utils import summarize_status_snapshot
 
 SCAN_INTERVAL = timedelta(seconds=DEFAULT_FALLBACK_POLL_SECS)
 
+# Monotonic clock bound once; the update path reads it several times per poll
+_monotonic = time.monotonic
+
+# Sentinel distinguishing a missing key from an explicit None value
+_MISSING = object()
+
 
 class FanSyncCoordinator(DataUpdateCoordinator[dict[str, dict[str, object]]]):
     """Coordinator for FanSync integration.
@@ -64,8 +73,11 @@ class FanSyncCoordinator(DataUpdateCoordinator[dict[str, dict[str, object]]]):
         self.client = client
         # Note: dr.async_get() is @callback decorated, safe to call in __init__
         self._device_registry = dr.async_get(hass)
-        # Track which devices have had registry updated to avoid redundant updates
-        self._registry_updated: set[str] = set()
+        # Hash of the profile fields last written to the registry per device; lets
+        # profile changes (e.g. firmware updates) through while skipping redundant updates
+        self._registry_hashes: dict[str, int] = {}
+        # Registry entry id per FanSync device id, resolved on first update
+        self._device_entry_ids: dict[str, str] = {}
         self._last_update_start_utc: str | None = None
         self._last_update_end_utc: str | None = None
         self._last_update_trigger: str | None = None
@@ -74,17 +86,55 @@ class FanSyncCoordinator(DataUpdateCoordinator[dict[str, dict[str, object]]]):
         self._last_update_success_utc: str | None = None
         self._last_update_duration_ms: float | None = None
         self._last_poll_mismatch_keys: dict[str, list[str]] = {}
-        self._last_poll_mismatch_history: list[dict[str, object]] = []
-        self._last_poll_mismatch_history_max = MISMATCH_HISTORY_MAX
-        self._status_history: list[dict[str, object]] = []
-        self._status_history_max = STATUS_HISTORY_MAX
+        self._last_poll_mismatch_history: deque[dict[str, object]] = deque(
+            maxlen=MISMATCH_HISTORY_MAX
+        )
+        self._status_history: deque[dict[str, object]] = deque(maxlen=STATUS_HISTORY_MAX)
         self._next_update_trigger: str | None = "startup"
+        # Bound in-flight status fetches so large accounts don't flood the cloud API
+        self._fetch_sem = asyncio.Semaphore(MAX_CONCURRENT_STATUS_FETCHES)
+        # In-flight single-device status fetches shared between entities
+        self._device_fetches: dict[str, asyncio.Task[dict[str, Any]]] = {}
 
     async def async_request_refresh(self) -> None:
         """Request a manual refresh and track the trigger for diagnostics."""
         self._next_update_trigger = "manual"
         await super().async_request_refresh()
 
+    async def async_get_device_status(self, device_id: str) -> dict[str, Any]:
+        """Fetch one device's status, sharing a fetch already in flight for it.
+
+        Entities confirming commands on the same device (e.g. fan and light from
+        one scene) await a single request instead of each issuing their own.
+        """
+        task = self._device_fetches.get(device_id)
+        if task is None:
+            task = self.hass.async_create_task(self.client.async_get_status(device_id))
+            self._device_fetches[device_id] = task
+            task.add_done_callback(lambda _t: self._device_fetches.pop(device_id, None))
+        # Shield so one caller's cancellation doesn't cancel the shared fetch
+        return await asyncio.shield(task)
+
+    @callback
+    def async_set_device_status(
+        self, device_id: str, status: dict[str, object], *, notify: bool = True
+    ) -> None:
+        """Publish one device's status without copying the aggregated mapping.
+
+        Patches the current mapping in place, then notifies listeners through
+        async_set_updated_data. Earlier references to ``data`` see the change.
+        With notify=False existing data is only patched; the caller writes its own
+        state. Before the first refresh there is nothing to patch, so listeners are
+        always notified.
+        """
+        data = self.data
+        if not isinstance(data, dict):
+            self.async_set_updated_data({device_id: status})
+            return
+        data[device_id] = status
+        if notify:
+            self.async_set_updated_data(data)
+
     def _update_device_registry(self, device_ids: list[str]) -> None:
         """Update device registry with latest profile data from client.
 
@@ -94,70 +144,98 @@ class FanSyncCoordinator(DataUpdateCoordinator[dict[str, dict[str, object]]]):
         Note: Safe to call from async context. Device registry methods with
         async_ prefix are @callback decorated and run in the event loop.
 
-        Only updates registry when profile data is newly available to avoid
-        redundant updates on every coordinator refresh.
+        Only updates registry when the profile fields feeding DeviceInfo (model,
+        brand, firmware version, MAC address) differ from the last update, so
+        firmware changes are picked up without rebuilding DeviceInfo or writing
+        the registry on every refresh.
         """
         for device_id in device_ids:
             if not device_id:
                 continue
-            # Skip if already updated and profile data hasn't changed
-            if hasattr(self.client, "device_profile"):
-                profile = self.client.device_profile(device_id)
-            else:
-                # Client doesn't have device_profile (e.g., in tests or old client)
-                profile = None
-            if not profile and device_id in self._registry_updated:
-                continue
-            if profile and device_id in self._registry_updated:
-                # Profile exists and we've already updated - skip redundant update
-                # NOTE: This doesn't detect profile changes (e.g., firmware updates).
-                # If profile change detection becomes needed, consider storing a hash
-                # of relevant fields (model, sw_version, connections) to trigger updates.
-                continue
-            # Get the device entry by identifier
-            device = self._device_registry.async_get_device(identifiers={(DOMAIN, device_id)})
-            if not device:
+            # Skip before building DeviceInfo if the profile fields are unchanged.
+            # None if the client lacks device_profile (e.g., in tests or old client)
+            profile = cached_device_profile(self.client, device_id)
+            fields_hash = _profile_fields_hash(profile)
+            if self._registry_hashes.get(device_id) == fields_hash:
                 continue
+            # Resolve the registry entry (cached by id; re-resolved if it was removed)
+            entry_id = self._device_entry_ids.get(device_id)
+            device = self._device_registry.async_get(entry_id) if entry_id else None
+            if device is None:
+                device = self._device_registry.async_get_device(identifiers={(DOMAIN, device_id)})
+                if not device:
+                    continue
+                self._device_entry_ids[device_id] = device.id
             # Build updated device info from current profile data
             device_info = create_device_info(self.client, device_id)
+            manufacturer = device_info.get("manufacturer")
+            model = device_info.get("model")
+            sw_version = device_info.get("sw_version")
+            connections = device_info.get("connections")
             # Only update if we have actual data to update (check for None, not falsiness)
-            if not any(
-                (
-                    device_info.get("manufacturer") is not None,
-                    device_info.get("model") is not None,
-                    device_info.get("sw_version") is not None,
-                    device_info.get("connections") is not None,
-                )
+            if (
+                manufacturer is None
+                and model is None
+                and sw_version is None
+                and connections is None
             ):
                 continue
+            # Skip the write (and its listener/storage cascade) if the entry matches
+            if (
+                device.manufacturer == manufacturer
+                and device.model == model
+                and device.sw_version == sw_version
+                and (not connections or connections <= device.connections)
+            ):
+                self._registry_hashes[device_id] = fields_hash
+                continue
             # Update the device registry entry with new information
             self._device_registry.async_update_device(
                 device.id,
-                manufacturer=device_info.get("manufacturer"),
-                model=device_info.get("model"),
-                sw_version=device_info.get("sw_version"),
-                merge_connections=device_info.get("connections") or UNDEFINED,
+                manufacturer=manufacturer,
+                model=model,
+                sw_version=sw_version,
+                merge_connections=connections or UNDEFINED,
             )
-            # Mark this device as updated
-            self._registry_updated.add(device_id)
+            # Remember which profile fields were written for this device
+            self._registry_hashes[device_id] = fields_hash
 
     async def _get_timeout_seconds(self) -> int:
         """Get dynamic timeout from client, with fallback to default."""
         try:
-            val = self.client.ws_timeout_seconds()
+            val: Any = self.client.ws_timeout_seconds()
         except AttributeError:
             return POLL_STATUS_TIMEOUT_SECS
-        if asyncio.iscoroutine(val):
+        # Plain ints (the real client) skip the awaitable check
+        if type(val) is not int and inspect.isawaitable(val):
             val = await val
         return int(val)
 
-    def _log_push_idle_if_needed(self) -> None:
-        """Log when polling occurs after a prolonged push idle period."""
-        if not self.update_interval or not self.logger.isEnabledFor(logging.DEBUG):
-            return
+    def _push_idle_seconds(self) -> float | None:
+        """Return seconds since the last push update, or None if none was received."""
         last_push = getattr(self.client, "_last_push_monotonic", None)
         if isinstance(last_push, float):
-            idle_s = time.monotonic() - last_push
+            return _monotonic() - last_push
+        return None
+
+    def _push_fresh_for_all(self, device_ids: list[str], max_idle_s: float) -> bool:
+        """Return True when every device received a push within max_idle_s."""
+        last_by_device = getattr(self.client, "_last_push_monotonic_by_device", None)
+        if not device_ids or not isinstance(last_by_device, dict):
+            return False
+        now = _monotonic()
+        for did in device_ids:
+            last = last_by_device.get(did)
+            if not isinstance(last, float) or now - last >= max_idle_s:
+                return False
+        return True
+
+    def _log_push_idle_if_needed(self, debug_on: bool) -> None:
+        """Log when polling occurs after a prolonged push idle period."""
+        if not self.update_interval or not debug_on:
+            return
+        idle_s = self._push_idle_seconds()
+        if idle_s is not None:
             interval_s = self.update_interval.total_seconds()
             if idle_s > interval_s:
                 self.logger.debug(
@@ -167,31 +245,54 @@ class FanSyncCoordinator(DataUpdateCoordinator[dict[str, dict[str, object]]]):
                 )
 
     async def _async_update_data(self) -> dict[str, dict[str, object]]:
-        start_monotonic = time.monotonic()
-        self._last_update_start_utc = datetime.now(UTC).isoformat()
+        start_monotonic = _monotonic()
+        self._last_update_start_utc = _now_iso()
         self._last_update_end_utc = None
+        # Resolve the DEBUG level once per update rather than at every log site
+        debug_on = self.logger.isEnabledFor(logging.DEBUG)
         try:
             # Aggregate status for all devices into a mapping
             statuses: dict[str, dict[str, object]] = {}
             ids = getattr(self.client, "device_ids", [])
+            # Bind hot-path callables once per update
+            get_status = self.client.async_get_status
+            log_debug = self.logger.debug
             # Debug: mark start of polling sync
             trigger = self._next_update_trigger or ("timer" if self.update_interval else "manual")
             self._next_update_trigger = None
-            if self.logger.isEnabledFor(logging.DEBUG):
-                self.logger.debug(
+            self._last_update_trigger = trigger
+            # Fallback polling is redundant while push is healthy: skip timer polls
+            # when every device pushed within the last half interval
+            if (
+                trigger == "timer"
+                and self.data
+                and self.update_interval
+                and self._push_fresh_for_all(
+                    ids or [self.client.device_id], self.update_interval.total_seconds() / 2
+                )
+            ):
+                if debug_on:
+                    log_debug("poll sync skipped push fresh devices=%d", len(self.data))
+                self._last_update_trigger = "timer_skipped_push_fresh"
+                # Profiles still change without a poll (e.g. after a reconnect)
+                self._update_device_registry(list(self.data.keys()))
+                # Nothing was polled: keep the last poll's success time and diagnostics
+                return self.data
+            if debug_on:
+                log_debug(
                     "poll sync start trigger=%s interval=%s ids=%s",
                     trigger,
                     self.update_interval,
                     ids or [self.client.device_id],
                 )
-            self._last_update_trigger = trigger
             timeout_devices: list[str] = []
             mismatch_keys: dict[str, list[str]] = {}
+            # The timeout is fixed for the whole update; resolve it once for all fetches
+            timeout_s = await self._get_timeout_seconds()
             if not ids:
                 # Fallback to single current device with timeout guard
-                timeout_s = await self._get_timeout_seconds()
                 try:
-                    s = await asyncio.wait_for(self.client.async_get_status(), timeout_s)
+                    s = await asyncio.wait_for(get_status(), timeout_s)
                     did = self.client.device_id or "unknown"
                     statuses[did] = s
                 except TimeoutError:
@@ -212,10 +313,10 @@ class FanSyncCoordinator(DataUpdateCoordinator[dict[str, dict[str, object]]]):
                     )
                     return self.data or {}
                 # Debug: log mismatches vs current coordinator snapshot
-                mismatch_keys = self._compute_mismatch_keys(self.data or {}, statuses)
-                self._log_push_idle_if_needed()
-                if self.logger.isEnabledFor(logging.DEBUG):
-                    self.logger.debug("poll sync done devices=%d", len(statuses))
+                mismatch_keys = self._compute_mismatch_keys(self.data or {}, statuses, debug_on)
+                self._log_push_idle_if_needed(debug_on)
+                if debug_on:
+                    log_debug("poll sync done devices=%d", len(statuses))
                 self._commit_successful_update(
                     statuses=statuses,
                     timeout_devices=timeout_devices,
@@ -224,11 +325,12 @@ class FanSyncCoordinator(DataUpdateCoordinator[dict[str, dict[str, object]]]):
                 )
                 return statuses
 
-            # Run per-device status in parallel with timeouts; tolerate partial failures
+            # Run per-device status in parallel (bounded) with timeouts; tolerate partial failures
             async def _get(did: str) -> tuple[str, dict[str, Any] | None]:
-                timeout_s = await self._get_timeout_seconds()
                 try:
-                    return did, await asyncio.wait_for(self.client.async_get_status(did), timeout_s)
+                    async with self._fetch_sem:
+                        status = await asyncio.wait_for(get_status(did), timeout_s)
+                    return did, status
                 except TimeoutError:
                     # Warn on per-device timeout; we'll tolerate partial failures
                     self.logger.warning(
@@ -239,7 +341,6 @@ class FanSyncCoordinator(DataUpdateCoordinator[dict[str, dict[str, object]]]):
                         did,
                         timeout_s,
                     )
-                    timeout_devices.append(did)
                     return did, None
                 except httpx.HTTPStatusError:
                     # Auth/HTTP failures (e.g. 401/403 during token refresh) must
@@ -255,10 +356,11 @@ class FanSyncCoordinator(DataUpdateCoordinator[dict[str, dict[str, object]]]):
                         did,
                         type(err).__name__,
                     )
-                    timeout_devices.append(did)
                     return did, None
 
             results = await asyncio.gather(*(_get(d) for d in ids))
+            # Failed fetches (timeout or error) come back as None
+            timeout_devices = [did for did, status in results if status is None]
             for did, status in results:
                 if isinstance(status, dict):
                     statuses[did] = status
@@ -272,10 +374,10 @@ class FanSyncCoordinator(DataUpdateCoordinator[dict[str, dict[str, object]]]):
                     if isinstance(prev_data, dict):
                         statuses[did] = prev_data
             # Debug: log mismatches for multi-device
-            mismatch_keys = self._compute_mismatch_keys(current, statuses)
-            self._log_push_idle_if_needed()
-            if self.logger.isEnabledFor(logging.DEBUG):
-                self.logger.debug("poll sync done devices=%d", len(statuses))
+            mismatch_keys = self._compute_mismatch_keys(current, statuses, debug_on)
+            self._log_push_idle_if_needed(debug_on)
+            if debug_on:
+                log_debug("poll sync done devices=%d", len(statuses))
             if not statuses:
                 # Keep last known data instead of failing; entities stay available
                 self.logger.warning(
@@ -284,14 +386,16 @@ class FanSyncCoordinator(DataUpdateCoordinator[dict[str, dict[str, object]]]):
                     len(ids),
                     ids,
                 )
+                now_iso = _now_iso()
                 self._finalize_update(
                     statuses=statuses,
                     timeout_devices=timeout_devices,
                     mismatch_keys=mismatch_keys,
                     success=False,
                     device_count=len(ids),
+                    now_iso=now_iso,
                 )
-                self._append_mismatch_history(mismatch_keys, len(ids))
+                self._append_mismatch_history(mismatch_keys, len(ids), now_iso)
                 return self.data or {}
             self._commit_successful_update(
                 statuses=statuses,
@@ -317,43 +421,48 @@ class FanSyncCoordinator(DataUpdateCoordinator[dict[str, dict[str, object]]]):
             raise
         finally:
             if self._last_update_end_utc is None:
-                self._last_update_end_utc = datetime.now(UTC).isoformat()
-            self._last_update_duration_ms = round((time.monotonic() - start_monotonic) * 1000, 2)
+                self._last_update_end_utc = _now_iso()
+            self._last_update_duration_ms = round((_monotonic() - start_monotonic) * 1000, 2)
 
-    def _append_status_history(self, statuses: dict[str, dict[str, object]]) -> None:
+    def _append_status_history(self, statuses: dict[str, dict[str, object]], now_iso: str) -> None:
         """Store a bounded history of recent status snapshots."""
         entry = {
-            "timestamp_utc": datetime.now(UTC).isoformat(),
+            "timestamp_utc": now_iso,
             "device_count": len(statuses),
             "summary": summarize_status_snapshot(statuses),
         }
         self._status_history.append(entry)
-        if len(self._status_history) > self._status_history_max:
-            self._status_history.pop(0)
 
-    def _append_mismatch_history(self, mismatch: dict[str, list[str]], device_count: int) -> None:
+    def _append_mismatch_history(
+        self, mismatch: dict[str, list[str]], device_count: int, now_iso: str
+    ) -> None:
         entry = {
-            "timestamp_utc": datetime.now(UTC).isoformat(),
+            "timestamp_utc": now_iso,
             "device_count": device_count,
             "mismatch_device_count": len(mismatch),
             "mismatch_keys": mismatch,
         }
         self._last_poll_mismatch_history.append(entry)
-        if len(self._last_poll_mismatch_history) > self._last_poll_mismatch_history_max:
-            self._last_poll_mismatch_history.pop(0)
 
     def _compute_mismatch_keys(
-        self, current: object, statuses: dict[str, dict[str, object]]
+        self, current: object, statuses: dict[str, dict[str, object]], debug_on: bool
     ) -> dict[str, list[str]]:
-        """Return per-device changed keys vs the current coordinator snapshot."""
+        """Return per-device changed keys vs the current coordinator snapshot.
+
+        The changed keys are always recorded for diagnostics; they are only
+        logged when DEBUG logging is enabled.
+        """
         mismatch: dict[str, list[str]] = {}
         if isinstance(current, dict):
             for did, status in statuses.items():
                 prev = current.get(did, {})
+                if prev is status:
+                    # Same object (e.g. kept last-known state): nothing to compare
+                    continue
                 if isinstance(prev, dict) and isinstance(status, dict) and prev != status:
                     changed = _changed_keys(prev, status)
                     mismatch[did] = changed
-                    if self.logger.isEnabledFor(logging.DEBUG):
+                    if debug_on:
                         self.logger.debug("poll mismatch d=%s changed_keys=%s", did, changed)
         return mismatch
 
@@ -367,15 +476,18 @@ class FanSyncCoordinator(DataUpdateCoordinator[dict[str, dict[str, object]]]):
     ) -> None:
         """Shared success path: registry refresh, status/mismatch history, finalize."""
         self._update_device_registry(list(statuses.keys()))
-        self._append_status_history(statuses)
+        # One timestamp for the history entries and the end/success markers
+        now_iso = _now_iso()
+        self._append_status_history(statuses, now_iso)
         self._finalize_update(
             statuses=statuses,
             timeout_devices=timeout_devices,
             mismatch_keys=mismatch_keys,
             success=True,
             device_count=device_count,
+            now_iso=now_iso,
         )
-        self._append_mismatch_history(mismatch_keys, device_count)
+        self._append_mismatch_history(mismatch_keys, device_count, now_iso)
 
     def _finalize_update(
         self,
@@ -385,15 +497,42 @@ class FanSyncCoordinator(DataUpdateCoordinator[dict[str, dict[str, object]]]):
         mismatch_keys: dict[str, list[str]],
         success: bool,
         device_count: int | None = None,
+        now_iso: str | None = None,
     ) -> None:
         self._last_update_timeout_devices = timeout_devices
         self._last_update_device_count = device_count if device_count is not None else len(statuses)
         self._last_poll_mismatch_keys = mismatch_keys
+        if now_iso is None:
+            now_iso = _now_iso()
         if success:
-            self._last_update_success_utc = datetime.now(UTC).isoformat()
-        self._last_update_end_utc = datetime.now(UTC).isoformat()
+            self._last_update_success_utc = now_iso
+        self._last_update_end_utc = now_iso
+
+
+def _now_iso() -> str:
+    """Return the current UTC time as an ISO 8601 string."""
+    return datetime.now(UTC).isoformat()
 
 
 def _changed_keys(prev: dict[str, object], new: dict[str, object]) -> list[str]:
-    changed = {k for k in set(prev) | set(new) if prev.get(k) != new.get(k)}
-    return sorted(changed)
+    changed = [k for k, v in new.items() if prev.get(k, _MISSING) != v]
+    changed.extend(k for k in prev if k not in new)
+    changed.sort()
+    return changed
+
+
+def _profile_fields_hash(profile: object) -> int:
+    """Hash the profile fields that feed the device registry entry."""
+    esh = profile.get("esh") if isinstance(profile, dict) else None
+    module = profile.get("module") if isinstance(profile, dict) else None
+    if not isinstance(esh, dict):
+        esh = {}
+    if not isinstance(module, dict):
+        module = {}
+    fields = (
+        esh.get("model"),
+        esh.get("brand"),
+        module.get("firmware_version"),
+        module.get("mac_address"),
+    )
+    return hash(tuple(f if isinstance(f, str) else None for f in fields))
@@ -21,34 +21,74 @@ from homeassistant.helpers.entity import DeviceInfo
 
 from .const import DOMAIN
 
+_DEBUG = logging.DEBUG
+# Shared read-only empty status; never mutate
+_EMPTY: dict[str, Any] = {}
+
+# (brand, model, firmware version, lowercased MAC, local IP) from a device profile
+_ProfileFields = tuple[Any, Any, str | None, str | None, str | None]
+_DEFAULT_FIELDS: _ProfileFields = ("Fanimation", "FanSync", None, None, None)
+# Fields last extracted per device, with the profile they came from. Memoized
+# profiles are shared until they change, so an identity match means the fields
+# are current; holding the profile keeps its id from being reused.
+_fields_by_device: dict[str, tuple[dict[str, Any], _ProfileFields]] = {}
+
+
+def cached_device_profile(client: Any, device_id: str) -> dict[str, Any] | None:
+    """Return the client's memoized profile for a device.
+
+    Entities read the profile on every device_info/attribute access, so they use
+    the client's ``device_profile_cached()`` rather than copying it each time.
+    Clients without it are read through ``device_profile()``. Callers must treat
+    the result as read-only. Returns None on profile errors.
+    """
+    getter = getattr(client, "device_profile_cached", None)
+    try:
+        if getter is None:
+            return client.device_profile(device_id)
+        return getter(device_id)
+    except Exception:
+        return None
+
+
+def _profile_fields(client: Any, device_id: str) -> _ProfileFields:
+    """Return the fields entities need from a device's profile.
+
+    Extraction is memoized per profile object; profile errors yield defaults.
+    """
+    prof = cached_device_profile(client, device_id)
+    if type(prof) is not dict:
+        return _DEFAULT_FIELDS
+    cached = _fields_by_device.get(device_id)
+    if cached is not None and cached[0] is prof:
+        return cached[1]
+    brand, model, sw, mac, ip = _DEFAULT_FIELDS
+    esh = prof.get("esh")
+    if type(esh) is dict:
+        model = esh.get("model", model)
+        brand = esh.get("brand", brand)
+    module = prof.get("module")
+    if type(module) is dict:
+        fv = module.get("firmware_version")
+        if type(fv) is str and fv:
+            sw = fv
+        m = module.get("mac_address")
+        if type(m) is str and m:
+            # Skip the copy when the API already reports lowercase
+            mac = m if m.islower() else m.lower()
+        ip_val = module.get("local_ip")
+        if type(ip_val) is str and ip_val:
+            ip = ip_val
+    fields: _ProfileFields = (brand, model, sw, mac, ip)
+    _fields_by_device[device_id] = (prof, fields)
+    return fields
+
 
 def create_device_info(client: Any, device_id: str) -> DeviceInfo:
     """Build DeviceInfo from the client's device profile for a device."""
     device_id = device_id or "unknown"
-    brand = "Fanimation"
-    model = "FanSync"
     name = "FanSync"
-    sw: str | None = None
-    mac: str | None = None
-
-    try:
-        prof = client.device_profile(device_id)
-        if isinstance(prof, dict):
-            esh = prof.get("esh")
-            if isinstance(esh, dict):
-                model = esh.get("model", model)
-                brand = esh.get("brand", brand)
-            module = prof.get("module")
-            if isinstance(module, dict):
-                fv = module.get("firmware_version")
-                if isinstance(fv, str) and fv:
-                    sw = fv
-                m = module.get("mac_address")
-                if isinstance(m, str) and m:
-                    mac = m.lower()
-    except Exception:
-        # Best-effort device info; ignore profile errors
-        pass
+    brand, model, sw, mac, _ = _profile_fields(client, device_id)
 
     # Prefer the user's display name from the account (e.g. "Living Room Fan")
     # so multi-fan households get distinct, meaningful device names instead of
@@ -80,19 +120,12 @@ def create_device_info(client: Any, device_id: str) -> DeviceInfo:
 
 def module_attrs(client: Any, device_id: str) -> dict[str, object] | None:
     """Return selected module attributes (local_ip, mac_address) for a device."""
-    try:
-        prof = client.device_profile(device_id)
-    except Exception:
-        prof = {}
-    module = prof.get("module") if isinstance(prof, dict) else None
+    _, _, _, mac, ip = _profile_fields(client, device_id)
     attrs: dict[str, object] = {}
-    if isinstance(module, dict):
-        ip = module.get("local_ip")
-        mac = module.get("mac_address")
-        if isinstance(ip, str) and ip:
-            attrs["local_ip"] = ip
-        if isinstance(mac, str) and mac:
-            attrs["mac_address"] = mac.lower()
+    if ip:
+        attrs["local_ip"] = ip
+    if mac:
+        attrs["mac_address"] = mac
     return attrs or None
 
 
@@ -109,12 +142,16 @@ def confirm_after_initial_delay(
     Returns (status, confirmed_by_push, ok).
     """
     if not confirmed_by_push:
-        return {}, confirmed_by_push, False
+        return _EMPTY, confirmed_by_push, False
 
-    data = coordinator_data or {}
-    status = data.get(device_id, {}) if isinstance(data, dict) else {}
+    data = coordinator_data if coordinator_data is not None else _EMPTY
+    try:
+        status = data.get(device_id, _EMPTY)
+    except AttributeError:
+        # Malformed (non-mapping) coordinator data
+        status = _EMPTY
     if predicate(status):
-        if logger.isEnabledFor(logging.DEBUG):
+        if logger.isEnabledFor(_DEBUG):
             logger.debug(
                 "optimism early confirm d=%s via push update",
                 device_id,
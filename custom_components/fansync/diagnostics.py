@@ -20,7 +20,10 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.redact import async_redact_data
 
-from .diagnostics_utils import summarize_status_snapshot
+from .device_utils import cached_device_profile
+from .diagnostics_utils import analyze_connection_quality, summarize_status_snapshot
+
+_MISSING: Any = object()
 
 
 async def async_get_config_entry_diagnostics(
@@ -31,20 +34,10 @@ async def async_get_config_entry_diagnostics(
     client = runtime_data["client"]
     coordinator = runtime_data["coordinator"]
 
-    diagnostics: dict[str, Any] = {
-        "config_entry": {
-            "entry_id": entry.entry_id,
-            "title": entry.title,
-            "version": entry.version,
-            "options": dict(entry.options),
-        },
-        "coordinator": {},
-        "connection_analysis": {},
-    }
-
     # Coordinator diagnostics
+    coordinator_block: dict[str, Any] = {}
     if coordinator:
-        diagnostics["coordinator"] = {
+        coordinator_block = {
             "update_interval": (
                 str(coordinator.update_interval) if coordinator.update_interval else None
             ),
@@ -58,69 +51,107 @@ async def async_get_config_entry_diagnostics(
             "last_update_success_utc": getattr(coordinator, "_last_update_success_utc", None),
             "last_update_duration_ms": getattr(coordinator, "_last_update_duration_ms", None),
             "last_poll_mismatch_keys": getattr(coordinator, "_last_poll_mismatch_keys", {}),
-            "last_poll_mismatch_history": getattr(coordinator, "_last_poll_mismatch_history", []),
-            "status_history": getattr(coordinator, "_status_history", []),
+            # Histories are bounded deques on the coordinator; export as lists
+            "last_poll_mismatch_history": list(
+                getattr(coordinator, "_last_poll_mismatch_history", [])
+            ),
+            "status_history": list(getattr(coordinator, "_status_history", [])),
             "device_count": len(coordinator.data) if coordinator.data else 0,
             "status_snapshot": summarize_status_snapshot(coordinator.data),
         }
 
+    diagnostics: dict[str, Any] = {
+        "config_entry": {
+            "entry_id": entry.entry_id,
+            "title": entry.title,
+            "version": entry.version,
+            "options": dict(entry.options),
+        },
+        "coordinator": coordinator_block,
+        "connection_analysis": {},
+    }
+
     # Client diagnostics
     if client:
         try:
             # Use new comprehensive diagnostics method
-            if hasattr(client, "get_diagnostics_data"):
-                client_diag = client.get_diagnostics_data()
-                diagnostics.update(client_diag)
+            get_diagnostics_data = getattr(client, "get_diagnostics_data", _MISSING)
+            if get_diagnostics_data is not _MISSING:
+                diagnostics.update(get_diagnostics_data())
 
-            # Add device IDs
-            device_ids = getattr(client, "device_ids", [])
+            # Add device IDs (materialized once; device_ids may be a computed property)
+            device_ids = tuple(getattr(client, "device_ids", ()) or ())
             diagnostics["device_ids"] = device_ids
 
             # Connection quality analysis
-            if hasattr(client, "metrics"):
-                metrics = client.metrics
-                analysis = _analyze_connection_quality(metrics)
+            metrics = getattr(client, "metrics", _MISSING)
+            if metrics is not _MISSING:
+                analysis = analyze_connection_quality(metrics)
                 diagnostics["connection_analysis"] = analysis
 
             # Device profiles (sanitized)
-            if hasattr(client, "device_profile"):
+            if getattr(client, "device_profile", _MISSING) is not _MISSING:
                 profiles = {}
+                # Prefer one batched read of all profiles over per-device lookups
+                snapshot = getattr(client, "device_profiles_snapshot", _MISSING)
+                all_profiles = snapshot() if snapshot is not _MISSING else None
+                if type(all_profiles) is not dict:
+                    all_profiles = None
                 for device_id in device_ids:
-                    profile = client.device_profile(device_id)
-                    if profile:
-                        # Include useful metadata, exclude sensitive data
-                        sanitized: dict[str, Any] = {}
-                        # Include the full esh block (device model / capability
-                        # descriptor: brand, model, class, device_id, esh_version).
-                        # It carries no secrets — the sensitive "cert" block is never
-                        # copied — and its fields help diagnose device-capability
-                        # issues (e.g. fans that advertise a light channel they lack).
-                        esh = profile.get("esh")
-                        if isinstance(esh, dict):
-                            sanitized["esh"] = dict(esh)
-                        # Surface which top-level profile blocks exist (not their
-                        # contents) so capability data outside esh is discoverable.
-                        sanitized["profile_keys"] = sorted(profile.keys())
-                        if "module" in profile:
-                            # Mask MAC address for privacy (show first 3 octets only)
-                            mac = profile["module"].get("mac_address", "")
-                            if mac and len(mac.split(":")) >= 3:
-                                masked_mac = ":".join(mac.split(":")[:3] + ["XX", "XX", "XX"])
-                            else:
-                                masked_mac = None
-                            sanitized["module"] = {
-                                "firmware_version": profile["module"].get("firmware_version"),
-                                "mac_address": masked_mac,
-                            }
-                        profiles[device_id] = sanitized
+                    if all_profiles is not None:
+                        profile = all_profiles.get(device_id)
+                    else:
+                        profile = cached_device_profile(client, device_id)
+                    if not profile:
+                        continue
+                    if "esh" not in profile and "module" not in profile:
+                        # Nothing to sanitize; still report which blocks exist
+                        profiles[device_id] = {"profile_keys": sorted(profile)}
+                        continue
+                    # Include useful metadata, exclude sensitive data
+                    sanitized: dict[str, Any] = {}
+                    # Include the full esh block (device model / capability
+                    # descriptor: brand, model, class, device_id, esh_version).
+                    # It carries no secrets — the sensitive "cert" block is never
+                    # copied — and its fields help diagnose device-capability
+                    # issues (e.g. fans that advertise a light channel they lack).
+                    esh = profile.get("esh")
+                    if isinstance(esh, dict):
+                        sanitized["esh"] = dict(esh)
+                    # Surface which top-level profile blocks exist (not their
+                    # contents) so capability data outside esh is discoverable.
+                    sanitized["profile_keys"] = sorted(profile)
+                    if "module" in profile:
+                        module = profile["module"]
+                        # Mask MAC address for privacy (show first 3 octets only)
+                        mac = module.get("mac_address", "")
+                        if (
+                            type(mac) is str
+                            and len(mac) == 17
+                            and mac[2] == ":"
+                            and mac[5] == ":"
+                            and mac[8] == ":"
+                        ):
+                            masked_mac: str | None = mac[:8] + ":XX:XX:XX"
+                        elif type(mac) is str and mac.count(":") >= 2:
+                            # Non-canonical MACs (e.g. unpadded octets) keep the old rule
+                            masked_mac = ":".join(mac.split(":")[:3] + ["XX", "XX", "XX"])
+                        else:
+                            masked_mac = None
+                        sanitized["module"] = {
+                            "firmware_version": module.get("firmware_version"),
+                            "mac_address": masked_mac,
+                        }
+                    profiles[device_id] = sanitized
                 diagnostics["device_profiles"] = profiles
 
             # Device metadata (sanitized)
-            if hasattr(client, "device_metadata"):
+            device_metadata = getattr(client, "device_metadata", _MISSING)
+            if device_metadata is not _MISSING:
                 meta = {}
                 for device_id in device_ids:
                     meta[device_id] = async_redact_data(
-                        client.device_metadata(device_id),
+                        device_metadata(device_id),
                         {
                             "access_token",
                             "api_key",
@@ -145,84 +176,3 @@ def _format_exception(exc: Exception | None) -> dict[str, str] | None:
     if exc is None:
         return None
     return {"type": type(exc).__name__, "message": str(exc)}
-
-
-def _analyze_connection_quality(metrics: Any) -> dict[str, Any]:
-    """Analyze connection metrics and provide recommendations."""
-    analysis: dict[str, Any] = {
-        "quality": "unknown",
-        "issues": [],
-        "recommendations": [],
-    }
-
-    if not metrics.is_connected:
-        analysis["quality"] = "disconnected"
-        analysis["issues"].append("Not currently connected to FanSync API")
-        analysis["recommendations"].append("Check network connectivity and credentials")
-        return analysis
-
-    if metrics.total_commands == 0:
-        analysis["quality"] = "no_data"
-        analysis["issues"].append("No commands have been sent yet")
-        return analysis
-
-    # Calculate metrics
-    success_rate = 1.0 - metrics.failure_rate
-    avg_latency = metrics.avg_latency_ms
-
-    # Determine quality
-    if success_rate >= 0.95 and avg_latency < 1000:
-        analysis["quality"] = "excellent"
-    elif success_rate >= 0.90 and avg_latency < 2000:
-        analysis["quality"] = "good"
-    elif success_rate >= 0.75 and avg_latency < 5000:
-        analysis["quality"] = "fair"
-    else:
-        analysis["quality"] = "poor"
-
-    # Identify issues
-    if success_rate < 0.90:
-        failed = metrics.failed_commands
-        total = metrics.total_commands
-        analysis["issues"].append(
-            f"Low success rate: {success_rate:.1%} ({failed}/{total} failures)"
-        )
-
-    if metrics.timeout_rate > 0.1:
-        timeouts = metrics.timed_out_commands
-        total = metrics.total_commands
-        analysis["issues"].append(f"High timeout rate: {timeouts} timeouts out of {total} commands")
-
-    if avg_latency > 2000:
-        analysis["issues"].append(f"High average latency: {avg_latency:.0f}ms")
-
-    if metrics.websocket_reconnects > 5:
-        analysis["issues"].append(
-            f"Frequent reconnections: {metrics.websocket_reconnects} reconnects"
-        )
-
-    # Provide recommendations
-    if avg_latency > 2000:
-        analysis["recommendations"].append(
-            "Consider increasing WebSocket timeout in integration options"
-        )
-
-    if metrics.timed_out_commands > 0:
-        analysis["recommendations"].append(
-            "Network latency may be high - check WiFi signal strength"
-        )
-
-    if metrics.websocket_reconnects > 5:
-        analysis["recommendations"].append(
-            "Unstable connection - verify network stability and router settings"
-        )
-
-    if success_rate < 0.75:
-        analysis["recommendations"].append(
-            "Poor connection quality - consider restarting Home Assistant or the FanSync device"
-        )
-
-    # Note: Recommendations are only added when there are actionable items
-    # An empty recommendations list indicates a healthy connection
-
-    return analysis
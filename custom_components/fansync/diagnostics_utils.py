@@ -13,6 +13,8 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any
 
 from .const import (
     KEY_DIRECTION,
@@ -23,30 +25,133 @@ from .const import (
     KEY_SPEED,
 )
 
+# (summary field, protocol key) pairs for the per-device fan and light sub-dicts
+_FAN_KEYS = (
+    ("power", KEY_POWER),
+    ("speed", KEY_SPEED),
+    ("preset", KEY_PRESET),
+    ("direction", KEY_DIRECTION),
+)
+_LIGHT_KEYS = (
+    ("power", KEY_LIGHT_POWER),
+    ("brightness", KEY_LIGHT_BRIGHTNESS),
+)
+
+# Connection quality tiers, best first: (quality, min success rate, max avg latency ms)
+_QUALITY_TABLE = (
+    ("excellent", 0.95, 1000),
+    ("good", 0.90, 2000),
+    ("fair", 0.75, 5000),
+)
+
+
+@lru_cache(maxsize=64)
+def _sorted_keys(keys: frozenset[str]) -> tuple[str, ...]:
+    """Return status keys in sorted order; devices share a small set of shapes."""
+    return tuple(sorted(keys))
+
 
 def summarize_status_snapshot(data: object | None) -> dict[str, dict[str, object]]:
     """Summarize per-device status for diagnostics."""
     summary: dict[str, dict[str, object]] = {}
     if data is None:
         return summary
-    if not isinstance(data, Mapping):
+    # Coordinator data is a plain dict decoded from JSON: test the exact type
+    # first (a pointer compare) and only fall back to the Mapping ABC check.
+    if type(data) is not dict and not isinstance(data, Mapping):
         return summary
 
+    # Bind module-level tables to locals for the per-device loop
+    fan_keys, light_keys, sorted_keys = _FAN_KEYS, _LIGHT_KEYS, _sorted_keys
     for device_id, status in data.items():
-        if not isinstance(status, Mapping):
+        # Read the status mapping directly; no per-device copy is needed
+        if type(status) is not dict and not isinstance(status, Mapping):
             continue
-        status_map = dict(status)
         summary[device_id] = {
-            "keys": sorted(status_map.keys()),
-            "fan": {
-                "power": status_map.get(KEY_POWER),
-                "speed": status_map.get(KEY_SPEED),
-                "preset": status_map.get(KEY_PRESET),
-                "direction": status_map.get(KEY_DIRECTION),
-            },
-            "light": {
-                "power": status_map.get(KEY_LIGHT_POWER),
-                "brightness": status_map.get(KEY_LIGHT_BRIGHTNESS),
-            },
+            "keys": sorted_keys(frozenset(status)),
+            "fan": {field: status.get(key) for field, key in fan_keys},
+            "light": {field: status.get(key) for field, key in light_keys},
         }
     return summary
+
+
+def analyze_connection_quality(metrics: Any) -> dict[str, Any]:
+    """Analyze connection metrics and provide recommendations."""
+    analysis: dict[str, Any] = {
+        "quality": "unknown",
+        "issues": [],
+        "recommendations": [],
+    }
+
+    if not metrics.is_connected:
+        analysis["quality"] = "disconnected"
+        analysis["issues"].append("Not currently connected to FanSync API")
+        analysis["recommendations"].append("Check network connectivity and credentials")
+        return analysis
+
+    total = metrics.total_commands
+    if total == 0:
+        analysis["quality"] = "no_data"
+        analysis["issues"].append("No commands have been sent yet")
+        return analysis
+
+    # Read each metric once
+    success_rate = 1.0 - metrics.failure_rate
+    avg_latency = metrics.avg_latency_ms
+    timeout_rate = metrics.timeout_rate
+    reconnects = metrics.websocket_reconnects
+    failed = metrics.failed_commands
+    timed_out = metrics.timed_out_commands
+
+    # Determine quality: first tier whose thresholds are met, else "poor"
+    analysis["quality"] = next(
+        (
+            quality
+            for quality, min_success, max_latency in _QUALITY_TABLE
+            if success_rate >= min_success and avg_latency < max_latency
+        ),
+        "poor",
+    )
+
+    # Identify issues
+    if success_rate < 0.90:
+        analysis["issues"].append(
+            f"Low success rate: {success_rate:.1%} ({failed}/{total} failures)"
+        )
+
+    if timeout_rate > 0.1:
+        analysis["issues"].append(
+            f"High timeout rate: {timed_out} timeouts out of {total} commands"
+        )
+
+    if avg_latency > 2000:
+        analysis["issues"].append(f"High average latency: {avg_latency:.0f}ms")
+
+    if reconnects > 5:
+        analysis["issues"].append(f"Frequent reconnections: {reconnects} reconnects")
+
+    # Provide recommendations
+    if avg_latency > 2000:
+        analysis["recommendations"].append(
+            "Consider increasing WebSocket timeout in integration options"
+        )
+
+    if timed_out > 0:
+        analysis["recommendations"].append(
+            "Network latency may be high - check WiFi signal strength"
+        )
+
+    if reconnects > 5:
+        analysis["recommendations"].append(
+            "Unstable connection - verify network stability and router settings"
+        )
+
+    if success_rate < 0.75:
+        analysis["recommendations"].append(
+            "Poor connection quality - consider restarting Home Assistant or the FanSync device"
+        )
+
+    # Note: Recommendations are only added when there are actionable items
+    # An empty recommendations list indicates a healthy connection
+
+    return analysis
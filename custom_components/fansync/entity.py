@@ -27,6 +27,7 @@ import asyncio
 import logging
 import time
 from collections.abc import Callable, Mapping
+from functools import partial
 
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -34,19 +35,36 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .client import FanSyncClient
 from .const import (
     CONFIRM_INITIAL_DELAY_SEC,
+    CONFIRM_LATENCY_ALPHA,
+    CONFIRM_MAX_DELAY_SEC,
     CONFIRM_RETRY_ATTEMPTS,
     CONFIRM_RETRY_DELAY_SEC,
+    OPTIMISTIC_GUARD_LATENCY_FACTOR,
+    OPTIMISTIC_GUARD_MARGIN_SEC,
     OPTIMISTIC_GUARD_SEC,
 )
 from .coordinator import FanSyncCoordinator
 from .device_utils import confirm_after_initial_delay, create_device_info, module_attrs
 
+# Shared empty status for missing data; read-only, never mutate
+_EMPTY: dict[str, object] = {}
+
+# (optimistic, payload, confirm predicate, shared result) for one command
+_Command = tuple[
+    dict[str, int], dict[str, int], Callable[[dict[str, object]], bool], asyncio.Future[None]
+]
+
+
+def status_matches(status: dict[str, object], expected: dict[str, int]) -> bool:
+    """Return True if every expected key has its target value in status."""
+    return all(status.get(k) == v for k, v in expected.items())
+
 
 class FanSyncOptimisticEntity(CoordinatorEntity[FanSyncCoordinator]):
     """Coordinator entity with shared optimistic-update behavior."""
 
     # Overlay keys that directly affect HA UI state; subclasses override.
-    OVERLAY_KEYS: set[str] = set()
+    OVERLAY_KEYS: frozenset[str] = frozenset()
 
     def __init__(
         self,
@@ -65,41 +83,65 @@ class FanSyncOptimisticEntity(CoordinatorEntity[FanSyncCoordinator]):
         self._retry_delay = CONFIRM_RETRY_DELAY_SEC
         self._optimistic_until: float | None = None
         self._optimistic_predicate: Callable[[dict[str, object]], bool] | None = None
+        # Smoothed seconds from command to confirmation; None until one is observed
+        self._confirm_latency: float | None = None
         # Per-key optimistic overlay to avoid snap-back during short races.
         # key -> (value, expires_at_monotonic)
         self._overlay: dict[str, tuple[int, float]] = {}
-        # Flag to signal early termination of confirmation polling when push confirms
-        self._confirmed_by_push: bool = False
+        # Monotonic timestamp and device status shared by property reads while one
+        # coordinator update writes state
+        self._update_now: float | None = None
+        self._update_status: dict[str, object] | None = None
+        # Set when a push update confirms the pending target; wakes confirmation polling
+        self._push_confirmed = asyncio.Event()
+        # Commands run one at a time; calls arriving meanwhile merge into one pending command
+        self._command_lock = asyncio.Lock()
+        self._pending_command: _Command | None = None
+        # State key last written from a coordinator update; None forces the next write
+        self._last_written: tuple[object, ...] | None = None
 
     def _log_state(self, status: dict[str, object]) -> None:
         """Hook for subclasses to emit per-entity debug state logs (no-op by default)."""
 
+    def _state_key(self) -> tuple[object, ...] | None:
+        """Hook returning the entity's observable state; None always writes state."""
+        return None
+
+    def _write_optimistic_state(self) -> None:
+        """Write state outside a coordinator update and force the next update to write."""
+        self._last_written = None
+        if self.hass is not None:
+            self.async_write_ha_state()
+
     def _status_for(self, payload: Mapping[str, object]) -> dict[str, object]:
         """Return this device's status mapping from an aggregated payload."""
         if isinstance(payload, dict):
             inner = payload.get(self._device_id, payload)
             if isinstance(inner, dict):
                 return inner
-        return {}
+        return _EMPTY
 
     def _get_with_overlay(self, key: str, default: int) -> int:
-        now = time.monotonic()
         entry = self._overlay.get(key)
         if entry is not None:
+            # Only overlaid keys need the clock
+            now = self._update_now
+            if now is None:
+                now = time.monotonic()
             value, expires = entry
             if now <= expires:
                 return value
-            # Overlay expired without confirmation
-            if self._logger.isEnabledFor(logging.DEBUG):
-                self._logger.debug(
-                    "overlay expired d=%s key=%s value=%s",
-                    self._device_id,
-                    key,
-                    value,
-                )
-            self._overlay.pop(key, None)
-        status = self._status_for(self.coordinator.data or {})
+            # Overlay expired without confirmation; drop every stale entry at once
+            self._expire_overlays(now)
+        # Read the coordinator's status in place; no per-read copy or allocation
+        status = self._update_status
+        if status is None:
+            data = self.coordinator.data
+            status = self._status_for(data) if data else _EMPTY
         raw = status.get(key, default)
+        # Status values are plain ints in practice; convert only the rare other types
+        if type(raw) is int:
+            return raw
         if isinstance(raw, int | str):
             try:
                 return int(raw)
@@ -107,19 +149,120 @@ class FanSyncOptimisticEntity(CoordinatorEntity[FanSyncCoordinator]):
                 pass
         return int(default)
 
+    def _expire_overlays(self, now: float) -> None:
+        """Remove all overlay entries whose guard window has passed."""
+        overlay = self._overlay
+        expired = [key for key, (_, expires) in overlay.items() if now > expires]
+        if not expired:
+            return
+        if self._logger.isEnabledFor(logging.DEBUG):
+            for key in expired:
+                self._logger.debug(
+                    "overlay expired d=%s key=%s value=%s",
+                    self._device_id,
+                    key,
+                    overlay[key][0],
+                )
+        if len(expired) == len(overlay):
+            # Entries from one command share an expiry, so this is the common case
+            overlay.clear()
+        else:
+            for key in expired:
+                del overlay[key]
+
+    def _confirm_window(self) -> float:
+        """Return the longest confirmation wait (push or polling), excluding request time."""
+        delay = self._retry_delay
+        polled = 0.0
+        for _ in range(self._retry_attempts - 1):
+            polled += delay
+            delay = min(delay * 2, CONFIRM_MAX_DELAY_SEC)
+        pushed = self._retry_attempts * self._retry_delay
+        return CONFIRM_INITIAL_DELAY_SEC + max(pushed, polled)
+
+    def _guard_seconds(self) -> float:
+        """Return the guard window, sized from this entity's observed confirm latency.
+
+        Never shorter than the confirmation window, so overlays outlast confirmation.
+        """
+        floor = self._confirm_window() + OPTIMISTIC_GUARD_MARGIN_SEC
+        latency = self._confirm_latency
+        if latency is None:
+            return max(OPTIMISTIC_GUARD_SEC, floor)
+        return max(min(latency * OPTIMISTIC_GUARD_LATENCY_FACTOR, OPTIMISTIC_GUARD_SEC), floor)
+
+    def _record_confirm_latency(self, seconds: float) -> None:
+        latency = self._confirm_latency
+        if latency is None:
+            self._confirm_latency = seconds
+        else:
+            self._confirm_latency = latency + CONFIRM_LATENCY_ALPHA * (seconds - latency)
+
+    def _clear_overlays(self, optimistic: dict[str, int]) -> None:
+        """Drop this command's overlays, keeping any a queued command has replaced."""
+        overlay = self._overlay
+        for k, v in optimistic.items():
+            entry = overlay.get(k)
+            if entry is not None and entry[0] == v:
+                del overlay[k]
+
+    @property
+    def _confirmed_by_push(self) -> bool:
+        """Return True once a coordinator update satisfied the pending target."""
+        return self._push_confirmed.is_set()
+
+    async def _sleep_unless_confirmed(self, delay: float) -> None:
+        """Sleep for delay, waking early if a push update confirms the target."""
+        event = self._push_confirmed
+        if event.is_set():
+            return
+        sleeper = asyncio.ensure_future(asyncio.sleep(delay))
+        waiter = asyncio.ensure_future(event.wait())
+        try:
+            await asyncio.wait((sleeper, waiter), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            sleeper.cancel()
+            waiter.cancel()
+
+    async def _await_push_confirm(
+        self, predicate: Callable[[dict[str, object]], bool]
+    ) -> tuple[dict[str, object], bool]:
+        """Wait for a push confirmation, with a single status fetch as a backstop."""
+        window = CONFIRM_INITIAL_DELAY_SEC + self._retry_attempts * self._retry_delay
+        await self._sleep_unless_confirmed(window)
+        status, confirmed, ok = confirm_after_initial_delay(
+            confirmed_by_push=self._push_confirmed.is_set(),
+            coordinator_data=self.coordinator.data,
+            device_id=self._device_id,
+            predicate=predicate,
+            logger=self._logger,
+        )
+        if ok:
+            return status, True
+        if not confirmed:
+            self._push_confirmed.clear()
+        status = await self.coordinator.async_get_device_status(self._device_id)
+        return status, predicate(status)
+
     async def _retry_update_until(
         self, predicate: Callable[[dict[str, object]], bool]
     ) -> tuple[dict[str, object], bool]:
         """Fetch status until predicate passes or attempts exhausted.
 
         Returns (status, satisfied). If not satisfied, caller may keep optimistic state.
-        Early terminates if push update confirms the change (via _confirmed_by_push flag).
+        Early terminates if push update confirms the change (via the _push_confirmed
+        event, which also cuts short any delay in progress).
         The predicate always receives this device's per-device status.
+        With push updates flowing, waits for the push instead of polling.
         """
+        if self.client.push_enabled:
+            return await self._await_push_confirm(predicate)
         status: dict[str, object] = {}
+        delay = self._retry_delay
+        last_attempt = self._retry_attempts - 1
         for attempt in range(self._retry_attempts):
             # Check if push update already confirmed before polling
-            if self._confirmed_by_push:
+            if self._push_confirmed.is_set():
                 # Get final status from coordinator data
                 data = self.coordinator.data or {}
                 status = data.get(self._device_id, {}) if isinstance(data, dict) else {}
@@ -131,71 +274,142 @@ class FanSyncOptimisticEntity(CoordinatorEntity[FanSyncCoordinator]):
                             self._device_id,
                         )
                     return status, True
-                # Predicate no longer satisfied, reset flag and continue polling
-                self._confirmed_by_push = False
+                # Predicate no longer satisfied, reset and continue polling
+                self._push_confirmed.clear()
 
             if attempt == 0 and CONFIRM_INITIAL_DELAY_SEC > 0:
-                await asyncio.sleep(CONFIRM_INITIAL_DELAY_SEC)
+                await self._sleep_unless_confirmed(CONFIRM_INITIAL_DELAY_SEC)
                 # Push may confirm during the initial delay; skip polling if so.
                 status, confirmed, ok = confirm_after_initial_delay(
-                    confirmed_by_push=self._confirmed_by_push,
+                    confirmed_by_push=self._push_confirmed.is_set(),
                     coordinator_data=self.coordinator.data,
                     device_id=self._device_id,
                     predicate=predicate,
                     logger=self._logger,
                 )
-                self._confirmed_by_push = confirmed
+                if not confirmed:
+                    self._push_confirmed.clear()
                 if ok:
                     return status, True
-            status = await self.client.async_get_status(self._device_id)
+            status = await self.coordinator.async_get_device_status(self._device_id)
             if predicate(status):
                 return status, True
-            await asyncio.sleep(self._retry_delay)
+            # Back off exponentially between polls; no sleep after the final poll
+            if attempt < last_attempt:
+                await self._sleep_unless_confirmed(delay)
+                delay = min(delay * 2, CONFIRM_MAX_DELAY_SEC)
         return status, False
 
+    async def _apply_coalesced(
+        self,
+        optimistic: dict[str, int],
+        payload: dict[str, int],
+        confirm_pred: Callable[[dict[str, object]], bool],
+    ) -> None:
+        """Apply a command, coalescing rapid calls behind the one in flight.
+
+        While a command is being applied, later calls merge into a single pending
+        command (later values win per key), so a slider drag sends only the latest
+        target once the in-flight command settles. The pending target shows in the
+        UI right away. Every caller merged into a command gets its outcome: success
+        or the exception it raised.
+        """
+        pending = self._pending_command
+        if pending is not None:
+            prev_optimistic, prev_payload, _, result = pending
+            optimistic = prev_optimistic | optimistic
+            payload = prev_payload | payload
+            # The merged command must confirm every key it sends
+            confirm_pred = partial(status_matches, expected=optimistic)
+        else:
+            result = asyncio.get_running_loop().create_future()
+        command: _Command = (optimistic, payload, confirm_pred, result)
+        self._pending_command = command
+        if self._command_lock.locked():
+            # Show the queued target now; the in-flight command keeps its own overlays.
+            # Hold it for a full guard past the in-flight window, since it only starts
+            # (and re-arms its overlays) once that command settles.
+            now = time.monotonic()
+            in_flight_until = self._optimistic_until
+            start = max(now, in_flight_until) if in_flight_until is not None else now
+            expires = start + self._guard_seconds()
+            for k, v in optimistic.items():
+                if k in self.OVERLAY_KEYS:
+                    self._overlay[k] = (int(v), expires)
+            self._write_optimistic_state()
+        async with self._command_lock:
+            # Otherwise merged into a newer command, which its own caller applies
+            if self._pending_command is command:
+                self._pending_command = None
+                try:
+                    await self._apply_with_optimism(optimistic, payload, confirm_pred)
+                except asyncio.CancelledError:
+                    result.cancel()
+                    raise
+                except Exception as exc:
+                    result.set_exception(exc)
+                else:
+                    result.set_result(None)
+        # Shielded so one merged caller's cancellation doesn't cancel the others
+        await asyncio.shield(result)
+
     async def _apply_with_optimism(
         self,
         optimistic: dict[str, int],
         payload: dict[str, int],
         confirm_pred: Callable[[dict[str, object]], bool],
     ) -> None:
+        # Resolve the DEBUG level once per command rather than at every log site
+        debug_on = self._logger.isEnabledFor(logging.DEBUG)
         # Merge optimistic values into this device's status within the
         # coordinator's aggregated mapping
         all_previous = self.coordinator.data or {}
         prev_for_device = (
-            all_previous.get(self._device_id, {}) if isinstance(all_previous, dict) else {}
+            all_previous.get(self._device_id) if isinstance(all_previous, dict) else None
+        )
+        # A command that changes nothing still goes to the device (it may need the
+        # nudge); only the local coordinator and state writes are skipped
+        status_changed = prev_for_device is None or any(
+            prev_for_device.get(k) != v for k, v in optimistic.items()
+        )
+        shown_changed = status_changed or any(
+            self._get_with_overlay(k, -1) != v for k, v in optimistic.items()
         )
-        optimistic_state_for_device = {**prev_for_device, **optimistic}
-        optimistic_all = dict(all_previous) if isinstance(all_previous, dict) else {}
-        optimistic_all[self._device_id] = optimistic_state_for_device
         # Apply per-key overlays to keep UI stable; use a shared guard window
-        if self._logger.isEnabledFor(logging.DEBUG):
+        guard = self._guard_seconds()
+        if debug_on:
             self._logger.debug(
                 "optimism start d=%s optimistic=%s expires_in=%.2fs",
                 self._device_id,
                 optimistic,
-                OPTIMISTIC_GUARD_SEC,
+                guard,
             )
-        expires = time.monotonic() + OPTIMISTIC_GUARD_SEC
+        started = time.monotonic()
+        expires = started + guard
         for k, v in optimistic.items():
             if k in self.OVERLAY_KEYS:
                 self._overlay[k] = (int(v), expires)
-        self.coordinator.async_set_updated_data(optimistic_all)
+        if status_changed:
+            # Only this device's status is rebuilt; the previous one is kept for revert.
+            # Only this entity's state changes; skip waking every coordinator listener
+            self.coordinator.async_set_device_status(
+                self._device_id, (prev_for_device or {}) | optimistic, notify=False
+            )
+        if shown_changed:
+            self._write_optimistic_state()
         # Guard against snap-back from interim coordinator refreshes
         self._optimistic_until = expires
         self._optimistic_predicate = confirm_pred
-        self._confirmed_by_push = False  # Reset flag for new optimistic update
+        self._push_confirmed.clear()  # Reset for new optimistic update
         try:
-            await self.client.async_set(payload, device_id=self._device_id)
+            acked = await self.client.async_set(payload, device_id=self._device_id)
         except RuntimeError as exc:
             # Only revert on explicit failure; otherwise keep optimistic state
             # Clear guard first so revert is not ignored
             self._optimistic_until = None
             self._optimistic_predicate = None
-            # Clear overlays
-            for k in optimistic:
-                self._overlay.pop(k, None)
-            if self._logger.isEnabledFor(logging.DEBUG):
+            self._clear_overlays(optimistic)
+            if debug_on:
                 self._logger.debug(
                     "optimism revert d=%s keys=%s overlay_count=%d error=%s",
                     self._device_id,
@@ -203,20 +417,36 @@ class FanSyncOptimisticEntity(CoordinatorEntity[FanSyncCoordinator]):
                     len(self._overlay),
                     type(exc).__name__,
                 )
-            self.coordinator.async_set_updated_data(all_previous)
+            if prev_for_device is not None:
+                self.coordinator.async_set_device_status(self._device_id, prev_for_device)
+            else:
+                # The device had no status before this command; drop the optimistic one
+                data = self.coordinator.data or {}
+                self.coordinator.async_set_updated_data(
+                    {did: st for did, st in data.items() if did != self._device_id}
+                )
             raise
-        status, ok = await self._retry_update_until(confirm_pred)
+        from_ack = isinstance(acked, dict) and confirm_pred(acked)
+        if from_ack:
+            # The set ack already reports the target state; no confirmation round trip
+            status, ok = acked, True
+        else:
+            status, ok = await self._retry_update_until(confirm_pred)
         if ok:
-            # Merge confirmed per-device status into aggregated mapping
-            new_all = dict(self.coordinator.data or {})
-            new_all[self._device_id] = status
-            self.coordinator.async_set_updated_data(new_all)
+            if not from_ack:
+                # Ack timing is only the WebSocket round trip, not device confirmation
+                self._record_confirm_latency(time.monotonic() - started)
+            # Merge confirmed per-device status into aggregated mapping, unless the
+            # coordinator already holds it (e.g. confirmed by push). The client's
+            # status callback already publishes ack status.
+            data = self.coordinator.data
+            current = self._status_for(data) if data else _EMPTY
+            if not from_ack and status is not current and status != current:
+                self.coordinator.async_set_device_status(self._device_id, status)
             self._optimistic_until = None
             self._optimistic_predicate = None
-            # Clear overlays on confirm
-            for k in optimistic:
-                self._overlay.pop(k, None)
-            if self._logger.isEnabledFor(logging.DEBUG):
+            self._clear_overlays(optimistic)
+            if debug_on:
                 self._logger.debug(
                     "optimism confirm d=%s keys=%s overlay_count=%d",
                     self._device_id,
@@ -235,34 +465,55 @@ class FanSyncOptimisticEntity(CoordinatorEntity[FanSyncCoordinator]):
     def _handle_coordinator_update(self) -> None:
         # During a grace window after a set, ignore updates that do not
         # satisfy the optimistic target to avoid UI snap-back.
-        if self._optimistic_until is not None and time.monotonic() < self._optimistic_until:
+        # Read the clock only while an overlay or guard is active
+        guard_until = self._optimistic_until
+        now: float | None = None
+        if self._overlay or guard_until is not None:
+            now = time.monotonic()
+            if self._overlay:
+                self._expire_overlays(now)
+        debug_on = self._logger.isEnabledFor(logging.DEBUG)
+        data = self.coordinator.data
+        status = self._status_for(data) if data else _EMPTY
+        if guard_until is not None and now is not None and now < guard_until:
             pred = self._optimistic_predicate
-            data = self.coordinator.data or {}
-            status = self._status_for(data)
             if callable(pred) and not pred(status):
-                if self._logger.isEnabledFor(logging.DEBUG):
-                    remaining = (
-                        self._optimistic_until - time.monotonic() if self._optimistic_until else 0.0
-                    )
+                if debug_on:
                     self._logger.debug(
                         "guard ignore d=%s overlays=%d remaining=%.2fs",
                         self._device_id,
                         len(self._overlay),
-                        max(0.0, remaining),
+                        max(0.0, guard_until - now),
                     )
                 return
             # Predicate satisfied (by push or polling); signal early termination of polling.
             # Note: Intended use case is confirmation via push, but this is set whenever
             # the predicate is satisfied during the guard period, regardless of update source.
-            self._confirmed_by_push = True
+            self._push_confirmed.set()
             # Clear the guard
             self._optimistic_until = None
             self._optimistic_predicate = None
 
         # Per-entity debug state logging (subclass hook)
-        self._log_state(self._status_for(self.coordinator.data or {}))
+        if debug_on:
+            self._log_state(status)
 
-        super()._handle_coordinator_update()
+        # Properties read while writing state reuse this update's timestamp and status
+        self._update_now = now
+        self._update_status = status
+        try:
+            # Skip the state write when nothing observable changed (e.g. another
+            # device's or an unrelated key's update)
+            key = self._state_key()
+            if key is not None:
+                key = (self.available, key, self.extra_state_attributes)
+                if key == self._last_written:
+                    return
+            super()._handle_coordinator_update()
+            self._last_written = key
+        finally:
+            self._update_now = None
+            self._update_status = None
 
     @property
     def device_info(self) -> DeviceInfo:
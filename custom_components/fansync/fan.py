@@ -15,6 +15,7 @@ from __future__ import annotations
 import asyncio  # noqa: F401  retained as a module-level patch seam for tests
 import logging
 import time  # noqa: F401  retained as a module-level patch seam for tests
+from functools import partial
 
 from homeassistant.components.fan import FanEntity, FanEntityFeature
 from homeassistant.config_entries import ConfigEntry
@@ -30,13 +31,14 @@ from .const import (
     KEY_PRESET,
     KEY_SPEED,
     PRESET_MODES,
+    PRESET_MODES_INV,
     clamp_percentage,
 )
 from .coordinator import FanSyncCoordinator
 from .entity import FanSyncOptimisticEntity
 
 # Only overlay keys that directly affect HA UI state to prevent snap-back
-OVERLAY_KEYS = {KEY_POWER, KEY_SPEED, KEY_DIRECTION, KEY_PRESET}
+OVERLAY_KEYS = frozenset({KEY_POWER, KEY_SPEED, KEY_DIRECTION, KEY_PRESET})
 
 # Coordinator handles all API calls; allow unlimited parallel entity updates (no semaphore)
 PARALLEL_UPDATES = 0
@@ -44,6 +46,23 @@ PARALLEL_UPDATES = 0
 _LOGGER = logging.getLogger(__name__)
 
 
+def _confirm_status(
+    status: dict[str, object],
+    *,
+    power: int | None = None,
+    speed: int | None = None,
+    preset: int | None = None,
+    direction: int | None = None,
+) -> bool:
+    """Return True if status shows every requested (non-None) target."""
+    return (
+        (power is None or status.get(KEY_POWER) == power)
+        and (speed is None or status.get(KEY_SPEED) == speed)
+        and (preset is None or status.get(KEY_PRESET) == preset)
+        and (direction is None or status.get(KEY_DIRECTION) == direction)
+    )
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -113,64 +132,58 @@ class FanSyncFan(FanSyncOptimisticEntity, FanEntity):
         else:
             target_speed = None
         if preset_mode is not None:
-            inv = {v: k for k, v in PRESET_MODES.items()}
-            target_preset = inv.get(preset_mode, 0)
+            target_preset = PRESET_MODES_INV.get(preset_mode, 0)
             optimistic[KEY_PRESET] = target_preset
             payload[KEY_PRESET] = target_preset
         else:
             target_preset = None
 
-        def _confirm(
-            s: dict[str, object],
-            ts: int | None = target_speed,
-            tp: int | None = target_preset,
-        ) -> bool:
-            return (
-                s.get(KEY_POWER) == 1
-                and (ts is None or s.get(KEY_SPEED) == ts)
-                and (tp is None or s.get(KEY_PRESET) == tp)
-            )
-
-        await self._apply_with_optimism(optimistic, payload, _confirm)
+        await self._apply_coalesced(
+            optimistic,
+            payload,
+            partial(_confirm_status, power=1, speed=target_speed, preset=target_preset),
+        )
 
     async def async_turn_off(self, **kwargs) -> None:
         # Toggling power should not change percentage speed
         optimistic = {KEY_POWER: 0}
         payload = {KEY_POWER: 0}
-        await self._apply_with_optimism(optimistic, payload, lambda s: s.get(KEY_POWER) == 0)
+        await self._apply_coalesced(optimistic, payload, partial(_confirm_status, power=0))
 
     async def async_set_percentage(self, percentage: int) -> None:
         target = clamp_percentage(percentage)
         # Adjusting percentage exits fresh-air (breeze) mode -> set preset to normal (0)
         optimistic = {KEY_POWER: 1, KEY_SPEED: target, KEY_PRESET: 0}
         payload = {KEY_POWER: 1, KEY_SPEED: target, KEY_PRESET: 0}
-        await self._apply_with_optimism(
+        await self._apply_coalesced(
             optimistic,
             payload,
-            lambda s: s.get(KEY_SPEED) == target and s.get(KEY_PRESET) == 0,
+            partial(_confirm_status, speed=target, preset=0),
         )
 
     async def async_set_direction(self, direction: str) -> None:
         target_dir = 0 if direction == "forward" else 1
         optimistic = {KEY_POWER: 1, KEY_DIRECTION: target_dir}
         payload = {KEY_POWER: 1, KEY_DIRECTION: target_dir}
-        await self._apply_with_optimism(
+        await self._apply_coalesced(
             optimistic,
             payload,
-            lambda s: s.get(KEY_DIRECTION) == target_dir,
+            partial(_confirm_status, direction=target_dir),
         )
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
-        inv = {v: k for k, v in PRESET_MODES.items()}
-        target_preset = inv.get(preset_mode, 0)
+        target_preset = PRESET_MODES_INV.get(preset_mode, 0)
         optimistic = {KEY_POWER: 1, KEY_PRESET: target_preset}
         payload = {KEY_POWER: 1, KEY_PRESET: target_preset}
-        await self._apply_with_optimism(
+        await self._apply_coalesced(
             optimistic,
             payload,
-            lambda s: s.get(KEY_PRESET) == target_preset,
+            partial(_confirm_status, preset=target_preset),
         )
 
+    def _state_key(self) -> tuple[object, ...]:
+        return (self.is_on, self.percentage, self.current_direction, self.preset_mode)
+
     def _log_state(self, status: dict[str, object]) -> None:
         if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
@@ -15,6 +15,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import time  # noqa: F401  retained as a module-level patch seam for tests
+from functools import partial
 
 from homeassistant.components.light import ColorMode, LightEntity
 from homeassistant.config_entries import ConfigEntry
@@ -33,10 +34,10 @@ from .const import (
     resolve_lightless_devices,
 )
 from .coordinator import FanSyncCoordinator
-from .entity import FanSyncOptimisticEntity
+from .entity import FanSyncOptimisticEntity, status_matches
 
 # Only overlay keys that directly affect HA UI state to prevent snap-back
-OVERLAY_KEYS = {KEY_LIGHT_POWER, KEY_LIGHT_BRIGHTNESS}
+OVERLAY_KEYS = frozenset({KEY_LIGHT_POWER, KEY_LIGHT_BRIGHTNESS})
 
 # Coordinator handles all API calls; allow unlimited parallel entity updates (no semaphore)
 PARALLEL_UPDATES = 0
@@ -60,7 +61,8 @@ async def async_setup_entry(
     if not isinstance(data, dict) or not data:
         try:
             # Use a short timeout to avoid blocking setup indefinitely
-            await asyncio.wait_for(coordinator.async_request_refresh(), timeout=5.0)
+            async with asyncio.timeout(5.0):
+                await coordinator.async_request_refresh()
             data = coordinator.data or {}
         except TimeoutError, UpdateFailed:
             # If refresh times out or fails, fall back to empty dict
@@ -112,23 +114,20 @@ class FanSyncLight(FanSyncOptimisticEntity, LightEntity):
             pct = ha_brightness_to_pct(brightness)
             optimistic[KEY_LIGHT_BRIGHTNESS] = pct
             payload[KEY_LIGHT_BRIGHTNESS] = pct
-        else:
-            pct = None
-
-        def _confirm(s: dict[str, object], pb: int | None = pct) -> bool:
-            return s.get(KEY_LIGHT_POWER) == 1 and (pb is None or s.get(KEY_LIGHT_BRIGHTNESS) == pb)
-
-        await self._apply_with_optimism(optimistic, payload, _confirm)
+        await self._apply_coalesced(
+            optimistic, payload, partial(status_matches, expected=optimistic)
+        )
 
     async def async_turn_off(self, **kwargs) -> None:
         optimistic = {KEY_LIGHT_POWER: 0}
         payload = {KEY_LIGHT_POWER: 0}
-        await self._apply_with_optimism(
-            optimistic,
-            payload,
-            lambda s: s.get(KEY_LIGHT_POWER) == 0,
+        await self._apply_coalesced(
+            optimistic, payload, partial(status_matches, expected=optimistic)
         )
 
+    def _state_key(self) -> tuple[object, ...]:
+        return (self.is_on, self.brightness)
+
     def _log_state(self, status: dict[str, object]) -> None:
         if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
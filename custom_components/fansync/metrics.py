@@ -14,7 +14,8 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+from collections import deque
+from dataclasses import dataclass, field
 from typing import Any
 
 
@@ -28,7 +29,7 @@ class ConnectionMetrics:
     timed_out_commands: int = 0
 
     # Latency tracking (milliseconds)
-    recent_latencies: list[float] = field(default_factory=list)
+    recent_latencies: deque[float] = field(default_factory=deque)
     max_latency_samples: int = 20
 
     # WebSocket statistics
@@ -40,6 +41,10 @@ class ConnectionMetrics:
     is_connected: bool = False
     consecutive_failures: int = 0
 
+    def __post_init__(self) -> None:
+        # Bounded window: appending evicts the oldest sample in O(1)
+        self.recent_latencies = deque(self.recent_latencies, maxlen=self.max_latency_samples)
+
     def record_command(self, success: bool, latency_ms: float | None = None) -> None:
         """Record a command execution."""
         self.total_commands += 1
@@ -50,9 +55,13 @@ class ConnectionMetrics:
             self.consecutive_failures = 0
 
         if latency_ms is not None:
-            self.recent_latencies.append(latency_ms)
-            if len(self.recent_latencies) > self.max_latency_samples:
-                self.recent_latencies.pop(0)
+            window = self.recent_latencies
+            limit = self.max_latency_samples
+            if type(window) is not deque or window.maxlen != limit:
+                # Re-bound after max_latency_samples or recent_latencies was reassigned
+                window = self.recent_latencies = deque(window, maxlen=limit)
+            # Appending to the bounded window evicts the oldest sample in O(1)
+            window.append(latency_ms)
 
     def record_timeout(self) -> None:
         """Record a command timeout."""
@@ -108,11 +117,22 @@ class ConnectionMetrics:
 
     def to_dict(self) -> dict[str, Any]:
         """Export metrics as dictionary for diagnostics."""
-        data = asdict(self)
-        # Add computed properties
-        data["avg_latency_ms"] = round(self.avg_latency_ms, 2)
-        data["max_latency_ms"] = round(self.max_latency_ms, 2)
-        data["failure_rate"] = round(self.failure_rate, 3)
-        data["timeout_rate"] = round(self.timeout_rate, 3)
-        data["should_warn"] = self.should_warn_user()
-        return data
+        # Flat fields listed explicitly; asdict() would deep-copy each one reflectively
+        return {
+            "total_commands": self.total_commands,
+            "failed_commands": self.failed_commands,
+            "timed_out_commands": self.timed_out_commands,
+            "recent_latencies": list(self.recent_latencies),
+            "max_latency_samples": self.max_latency_samples,
+            "websocket_reconnects": self.websocket_reconnects,
+            "websocket_errors": self.websocket_errors,
+            "push_updates_received": self.push_updates_received,
+            "is_connected": self.is_connected,
+            "consecutive_failures": self.consecutive_failures,
+            # Computed properties
+            "avg_latency_ms": round(self.avg_latency_ms, 2),
+            "max_latency_ms": round(self.max_latency_ms, 2),
+            "failure_rate": round(self.failure_rate, 3),
+            "timeout_rate": round(self.timeout_rate, 3),
+            "should_warn": self.should_warn_user(),
+        }
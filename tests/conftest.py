@@ -78,6 +78,7 @@ def mock_executor_for_ssl() -> Generator[None]:
 def mock_client():
     class _Mock:
         def __init__(self):
+            self.push_enabled = False
             self.status = {"H00": 1, "H02": 41, "H06": 0, "H01": 0, "H0B": 0, "H0C": 0}
             self.device_id = "test-device"
             self.device_ids = [self.device_id]
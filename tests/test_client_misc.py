@@ -166,3 +166,17 @@ async def test_push_ignores_irrelevant_frames(hass: HomeAssistant, mock_websocke
             await c.async_disconnect()
 
     assert seen and seen[-1].get("H02") == 99
+
+
+def test_device_profiles_snapshot_returns_all_profiles(hass: HomeAssistant):
+    """Snapshot exposes every cached profile without mutating client state."""
+    c = FanSyncClient(hass, "e", "p", enable_push=False)
+    c._device_profile = {
+        "a": {"esh": {"model": "A"}},
+        "b": {"module": {"firmware_version": "1.0"}},
+    }
+
+    snapshot = c.device_profiles_snapshot()
+    assert snapshot == c._device_profile
+    snapshot.pop("a")
+    assert "a" in c._device_profile
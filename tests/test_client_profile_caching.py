@@ -22,6 +22,7 @@ import pytest
 from homeassistant.core import HomeAssistant
 
 from custom_components.fansync.client import FanSyncClient
+from custom_components.fansync.device_utils import cached_device_profile
 
 
 @pytest.mark.asyncio
@@ -485,13 +486,18 @@ async def test_profile_caching_updates_existing(hass: HomeAssistant, mock_websoc
 
         profile = client.device_profile("test_device")
         assert profile["module"]["firmware_version"] == "1.0.0"
+        cached = cached_device_profile(client, "test_device")
+        assert cached is cached_device_profile(client, "test_device")
 
         # Second call - updated profile
         await client.async_get_status()
 
-        # Verify profile was updated
+        # Verify profile was updated, including the entity-facing cached copy
         profile = client.device_profile("test_device")
         assert profile["module"]["firmware_version"] == "2.0.0"
+        cached = cached_device_profile(client, "test_device")
+        assert cached is not None
+        assert cached["module"]["firmware_version"] == "2.0.0"
 
         await client.async_disconnect()
 
@@ -637,3 +643,17 @@ async def test_profile_retrieval_nonexistent_device(hass: HomeAssistant) -> None
 
     # Should return empty dict, not raise exception
     assert profile == {}
+
+
+def test_profile_cached_is_per_client(hass: HomeAssistant) -> None:
+    """Each client memoizes its own profile copies."""
+    first = FanSyncClient(hass, "e", "p", enable_push=False)
+    second = FanSyncClient(hass, "e", "p", enable_push=False)
+    first._device_profile = {"dev": {"esh": {"model": "A"}}}
+    second._device_profile = {"dev": {"esh": {"model": "B"}}}
+
+    profile = first.device_profile_cached("dev")
+    assert profile == {"esh": {"model": "A"}}
+    assert first.device_profile_cached("dev") is profile
+    assert cached_device_profile(first, "dev") is profile
+    assert cached_device_profile(second, "dev") == {"esh": {"model": "B"}}
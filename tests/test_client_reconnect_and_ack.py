@@ -84,12 +84,13 @@ async def test_set_uses_ack_status_when_present(hass: HomeAssistant, mock_websoc
 
         await c.async_connect()
         try:
-            await c.async_set({"H00": 0})
+            acked = await c.async_set({"H00": 0})
             await asyncio.sleep(0.3)
             await hass.async_block_till_done()
         finally:
             await c.async_disconnect()
 
+    assert acked == {"H00": 0, "H02": 1}
     assert seen and seen[-1].get("H00") == 0
 
 
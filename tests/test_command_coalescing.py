@@ -0,0 +1,138 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Trevor Baker, all rights reserved.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#   http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Rapid commands on one entity coalesce behind the command in flight."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.fansync.fan import FanSyncFan
+
+
+class GatedClient:
+    def __init__(self) -> None:
+        self.push_enabled = False
+        self.status = {"H00": 1, "H02": 20, "H06": 0, "H01": 0}
+        self.sent: list[dict[str, int]] = []
+        self.release = asyncio.Event()
+
+    async def async_set(self, data: dict[str, int], *, device_id: str | None = None) -> None:
+        self.sent.append(dict(data))
+        await self.release.wait()
+        self.status.update(data)
+
+    async def async_get_status(self, device_id: str | None = None) -> dict[str, int]:
+        return dict(self.status)
+
+
+async def test_rapid_sets_send_only_latest_target(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("custom_components.fansync.entity.CONFIRM_INITIAL_DELAY_SEC", 0)
+    client = GatedClient()
+    coordinator = MagicMock()
+    coordinator.data = {"dev": dict(client.status)}
+    coordinator.async_get_device_status = client.async_get_status
+    fan = FanSyncFan(coordinator, client, "dev")  # type: ignore[arg-type]
+
+    first = asyncio.create_task(fan.async_set_percentage(30))
+    await asyncio.sleep(0)
+    # Both arrive while the first command is still in flight
+    second = asyncio.create_task(fan.async_set_percentage(40))
+    third = asyncio.create_task(fan.async_set_percentage(50))
+    await asyncio.sleep(0)
+
+    client.release.set()
+    await asyncio.gather(first, second, third)
+
+    assert [payload["H02"] for payload in client.sent] == [30, 50]
+    assert client.status["H02"] == 50
+
+
+async def test_queued_target_shows_while_command_in_flight(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("custom_components.fansync.entity.CONFIRM_INITIAL_DELAY_SEC", 0)
+    client = GatedClient()
+    coordinator = MagicMock()
+    coordinator.data = {"dev": dict(client.status)}
+    coordinator.async_get_device_status = client.async_get_status
+    fan = FanSyncFan(coordinator, client, "dev")  # type: ignore[arg-type]
+
+    first = asyncio.create_task(fan.async_set_percentage(30))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(fan.async_set_percentage(50))
+    await asyncio.sleep(0)
+    # The queued target wins over the in-flight one before anything is sent
+    assert fan.percentage == 50
+
+    client.release.set()
+    await asyncio.gather(first, second)
+    assert client.sent[-1]["H02"] == 50
+
+
+async def test_queued_overlay_outlasts_in_flight_window(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("custom_components.fansync.entity.CONFIRM_INITIAL_DELAY_SEC", 0)
+    client = GatedClient()
+    coordinator = MagicMock()
+    coordinator.data = {"dev": dict(client.status)}
+    coordinator.async_get_device_status = client.async_get_status
+    fan = FanSyncFan(coordinator, client, "dev")  # type: ignore[arg-type]
+
+    first = asyncio.create_task(fan.async_set_percentage(30))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(fan.async_set_percentage(50))
+    await asyncio.sleep(0)
+    in_flight_until = fan._optimistic_until
+    assert in_flight_until is not None
+    # The queued overlay covers the wait for the lock plus its own guard window
+    _, queued_expires = fan._overlay["H02"]
+    assert queued_expires >= in_flight_until + fan._guard_seconds()
+
+    client.release.set()
+    await asyncio.gather(first, second)
+
+
+class FailingSecondSetClient(GatedClient):
+    async def async_set(self, data: dict[str, int], *, device_id: str | None = None) -> None:
+        if self.sent:
+            self.sent.append(dict(data))
+            raise RuntimeError("set rejected")
+        await super().async_set(data, device_id=device_id)
+
+
+async def test_merged_callers_share_command_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("custom_components.fansync.entity.CONFIRM_INITIAL_DELAY_SEC", 0)
+    client = FailingSecondSetClient()
+    coordinator = MagicMock()
+    coordinator.data = {"dev": dict(client.status)}
+    coordinator.async_get_device_status = client.async_get_status
+    fan = FanSyncFan(coordinator, client, "dev")  # type: ignore[arg-type]
+
+    first = asyncio.create_task(fan.async_set_percentage(30))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(fan.async_set_percentage(40))
+    third = asyncio.create_task(fan.async_set_percentage(50))
+    await asyncio.sleep(0)
+
+    client.release.set()
+    results = await asyncio.gather(first, second, third, return_exceptions=True)
+
+    assert [payload["H02"] for payload in client.sent] == [30, 50]
+    # The merged 40/50 command failed; both of its callers see the error
+    assert results[0] is None
+    assert isinstance(results[1], RuntimeError)
+    assert isinstance(results[2], RuntimeError)
@@ -12,6 +12,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from unittest.mock import patch
+
 from homeassistant.core import HomeAssistant
 
 from custom_components.fansync.coordinator import FanSyncCoordinator
@@ -67,3 +71,142 @@ async def test_single_device_timeout_keeps_last_known_state(
     # Timeout should return last known data, not raise UpdateFailed
     data = await coord._async_update_data()
     assert data == {"dev": {"H00": 1, "H02": 50}}
+
+
+async def test_timer_poll_skipped_when_push_fresh(hass: HomeAssistant, mock_config_entry) -> None:
+    client = _ClientStub(["d1"])
+
+    async def _get_status(_did: str | None = None):
+        raise AssertionError("status should not be fetched while push is fresh")
+
+    client.async_get_status = _get_status  # type: ignore[assignment]
+    client._last_push_monotonic_by_device = {"d1": time.monotonic()}  # type: ignore[attr-defined]
+    coord = FanSyncCoordinator(hass, client, mock_config_entry)
+    coord._next_update_trigger = None  # timer-driven update
+    coord.data = {"d1": {"H00": 1}}
+
+    coord._last_update_timeout_devices = ["d1"]
+    coord._last_poll_mismatch_keys = {"d1": ["H00"]}
+
+    with patch.object(coord, "_update_device_registry") as refresh_registry:
+        data = await coord._async_update_data()
+    assert data == {"d1": {"H00": 1}}
+    assert coord._last_update_trigger == "timer_skipped_push_fresh"
+    refresh_registry.assert_called_once_with(["d1"])
+    # The last poll's diagnostics survive a skipped poll, which is not a successful poll
+    assert coord._last_update_success_utc is None
+    assert coord._last_update_timeout_devices == ["d1"]
+    assert coord._last_poll_mismatch_keys == {"d1": ["H00"]}
+
+
+async def test_timer_poll_runs_when_any_device_push_stale(
+    hass: HomeAssistant, mock_config_entry
+) -> None:
+    client = _ClientStub(["d1", "d2"])
+
+    async def _get_status(did: str | None = None):
+        return {"H00": 0}
+
+    client.async_get_status = _get_status  # type: ignore[assignment]
+    # d2 has not pushed recently even though the account as a whole has
+    client._last_push_monotonic = time.monotonic()  # type: ignore[attr-defined]
+    client._last_push_monotonic_by_device = {"d1": time.monotonic()}  # type: ignore[attr-defined]
+    coord = FanSyncCoordinator(hass, client, mock_config_entry)
+    coord._next_update_trigger = None
+    coord.data = {"d1": {"H00": 1}, "d2": {"H00": 1}}
+
+    data = await coord._async_update_data()
+    assert data == {"d1": {"H00": 0}, "d2": {"H00": 0}}
+    assert coord._last_update_trigger == "timer"
+
+
+async def test_timer_poll_runs_when_push_stale(hass: HomeAssistant, mock_config_entry) -> None:
+    client = _ClientStub(["d1"])
+
+    async def _get_status(_did: str | None = None):
+        return {"H00": 0}
+
+    client.async_get_status = _get_status  # type: ignore[assignment]
+    client._last_push_monotonic_by_device = {  # type: ignore[attr-defined]
+        "d1": time.monotonic() - 3600
+    }
+    coord = FanSyncCoordinator(hass, client, mock_config_entry)
+    coord._next_update_trigger = None
+    coord.data = {"d1": {"H00": 1}}
+
+    data = await coord._async_update_data()
+    assert data == {"d1": {"H00": 0}}
+    assert coord._last_update_trigger == "timer"
+
+
+async def test_concurrent_device_fetches_share_one_request(
+    hass: HomeAssistant, mock_config_entry
+) -> None:
+    client = _ClientStub(["d1"])
+    calls: list[str | None] = []
+    release = asyncio.Event()
+
+    async def _get_status(did: str | None = None):
+        calls.append(did)
+        await release.wait()
+        return {"H00": 1, "H02": 30}
+
+    client.async_get_status = _get_status  # type: ignore[assignment]
+    coord = FanSyncCoordinator(hass, client, mock_config_entry)
+
+    first = asyncio.create_task(coord.async_get_device_status("d1"))
+    second = asyncio.create_task(coord.async_get_device_status("d1"))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await first == await second == {"H00": 1, "H02": 30}
+    assert calls == ["d1"]
+    await hass.async_block_till_done()
+    # Finished fetches are not reused
+    await coord.async_get_device_status("d1")
+    assert calls == ["d1", "d1"]
+
+
+async def test_set_device_status_patches_in_place(hass: HomeAssistant, mock_config_entry) -> None:
+    client = _ClientStub(["d1", "d2"])
+    coord = FanSyncCoordinator(hass, client, mock_config_entry)
+    data = {"d1": {"H00": 0}, "d2": {"H00": 1}}
+    coord.async_set_updated_data(data)
+    updates: list[object] = []
+    unsub = coord.async_add_listener(lambda: updates.append(coord.data))
+
+    coord.async_set_device_status("d1", {"H00": 1})
+
+    assert coord.data is data
+    assert data == {"d1": {"H00": 1}, "d2": {"H00": 1}}
+    assert updates == [data]
+    unsub()
+
+
+async def test_set_device_status_without_notify(hass: HomeAssistant, mock_config_entry) -> None:
+    client = _ClientStub(["d1"])
+    coord = FanSyncCoordinator(hass, client, mock_config_entry)
+    coord.async_set_updated_data({"d1": {"H00": 0}})
+    updates: list[object] = []
+    unsub = coord.async_add_listener(lambda: updates.append(coord.data))
+
+    coord.async_set_device_status("d1", {"H00": 1}, notify=False)
+
+    assert coord.data == {"d1": {"H00": 1}}
+    assert updates == []
+    unsub()
+
+
+async def test_timeout_getter_may_return_awaitable(hass: HomeAssistant, mock_config_entry) -> None:
+    client = _ClientStub(["d1"])
+
+    async def _timeout() -> int:
+        return 7
+
+    # A plain callable that returns a coroutine, then one that returns an int
+    client.ws_timeout_seconds = lambda: _timeout()  # type: ignore[attr-defined]
+    coord = FanSyncCoordinator(hass, client, mock_config_entry)
+    assert await coord._get_timeout_seconds() == 7
+
+    client.ws_timeout_seconds = lambda: 9  # type: ignore[attr-defined]
+    assert await coord._get_timeout_seconds() == 9
@@ -21,6 +21,7 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 
 class BaseClient:
+    push_enabled = False
     device_ids: list[str]
     device_id: str
     status: dict[str, int]
@@ -16,8 +16,10 @@ from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
 
 from custom_components.fansync.client import FanSyncClient
+from custom_components.fansync.const import DOMAIN
 from custom_components.fansync.coordinator import FanSyncCoordinator
 
 
@@ -28,8 +30,8 @@ async def test_device_registry_updated_on_refresh(hass: HomeAssistant, mock_conf
     client.device_id = "test_device_123"
     client.device_ids = ["test_device_123"]
 
-    # Mock device_profile to return rich metadata
-    client.device_profile.return_value = {
+    # Mock device_profile_cached to return rich metadata
+    client.device_profile_cached.return_value = {
         "module": {
             "mac_address": "AA:BB:CC:DD:EE:FF",
             "firmware_version": "1.2.3",
@@ -65,7 +67,7 @@ async def test_device_registry_multi_device_update(hass: HomeAssistant, mock_con
     client = MagicMock(spec=FanSyncClient)
     client.device_ids = ["device_1", "device_2"]
 
-    # Mock device_profile to return different data for each device
+    # Mock device_profile_cached to return different data for each device
     def mock_device_profile(device_id: str) -> dict[str, Any]:
         profiles = {
             "device_1": {
@@ -79,7 +81,7 @@ async def test_device_registry_multi_device_update(hass: HomeAssistant, mock_con
         }
         return profiles.get(device_id, {})
 
-    client.device_profile = MagicMock(side_effect=mock_device_profile)
+    client.device_profile_cached = MagicMock(side_effect=mock_device_profile)
 
     # Mock async_get_status for multiple devices
     async def mock_get_status(device_id: str | None = None) -> dict[str, int]:
@@ -98,3 +100,42 @@ async def test_device_registry_multi_device_update(hass: HomeAssistant, mock_con
     assert coordinator.data is not None
     assert "device_1" in coordinator.data
     assert "device_2" in coordinator.data
+
+
+async def test_device_registry_picks_up_firmware_change(
+    hass: HomeAssistant, mock_config_entry
+) -> None:
+    """Test that a profile change re-runs the registry update, but only once."""
+    mock_config_entry.add_to_hass(hass)
+    registry = dr.async_get(hass)
+    registry.async_get_or_create(
+        config_entry_id=mock_config_entry.entry_id,
+        identifiers={(DOMAIN, "device_1")},
+    )
+
+    profile: dict[str, Any] = {
+        "module": {"firmware_version": "1.0.0", "mac_address": "AA:BB:CC:DD:EE:FF"},
+        "esh": {"model": "Fan Model A", "brand": "BrandA"},
+    }
+    client = MagicMock(spec=FanSyncClient)
+    client.device_profile_cached = MagicMock(side_effect=lambda _did: profile)
+
+    coordinator = FanSyncCoordinator(hass, client, mock_config_entry)
+    coordinator._update_device_registry(["device_1"])
+    device = registry.async_get_device(identifiers={(DOMAIN, "device_1")})
+    assert device is not None
+    assert device.sw_version == "1.0.0"
+
+    # Unchanged profile: no further registry writes
+    original_update = registry.async_update_device
+    registry.async_update_device = MagicMock(side_effect=original_update)
+    coordinator._update_device_registry(["device_1"])
+    registry.async_update_device.assert_not_called()
+
+    # Firmware bump: registry is updated with the new version
+    profile["module"]["firmware_version"] = "1.1.0"
+    coordinator._update_device_registry(["device_1"])
+    assert registry.async_update_device.call_count == 1
+    device = registry.async_get_device(identifiers={(DOMAIN, "device_1")})
+    assert device is not None
+    assert device.sw_version == "1.1.0"
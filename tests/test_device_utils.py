@@ -17,7 +17,11 @@ from typing import cast
 
 import pytest
 
-from custom_components.fansync.device_utils import confirm_after_initial_delay
+from custom_components.fansync.device_utils import (
+    confirm_after_initial_delay,
+    create_device_info,
+    module_attrs,
+)
 
 
 def test_confirm_after_initial_delay_not_confirmed() -> None:
@@ -101,3 +105,40 @@ def test_confirm_after_initial_delay_bad_data() -> None:
     assert status == {}
     assert confirmed is False
     assert ok is False
+
+
+class _ProfileClient:
+    def __init__(self) -> None:
+        self.profile = {
+            "esh": {"model": "Fan A", "brand": "Brand"},
+            "module": {"mac_address": "AA:BB:CC:DD:EE:FF", "local_ip": "10.0.0.2"},
+        }
+
+    def device_profile_cached(self, device_id: str) -> dict:
+        return self.profile
+
+    def device_metadata(self, device_id: str) -> dict:
+        return {}
+
+
+def test_device_info_and_module_attrs_are_fresh_per_call() -> None:
+    """Entities never share (and so cannot corrupt) one DeviceInfo or attrs dict."""
+    client = _ProfileClient()
+
+    first = create_device_info(client, "dev")
+    second = create_device_info(client, "dev")
+    assert first == second
+    assert first is not second
+    assert first["connections"] is not second["connections"]
+
+    attrs = module_attrs(client, "dev")
+    assert attrs == {"local_ip": "10.0.0.2", "mac_address": "aa:bb:cc:dd:ee:ff"}
+    attrs["local_ip"] = "mutated"
+    assert module_attrs(client, "dev") == {
+        "local_ip": "10.0.0.2",
+        "mac_address": "aa:bb:cc:dd:ee:ff",
+    }
+
+    # A changed (new) profile object is re-read
+    client.profile = {"esh": {"model": "Fan B"}}
+    assert create_device_info(client, "dev")["model"] == "Fan B"
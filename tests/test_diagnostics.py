@@ -96,14 +96,14 @@ async def test_diagnostics_returns_metrics(hass: HomeAssistant) -> None:
 
     client.get_diagnostics_data = mock_get_diagnostics_data
 
-    # Mock device_profile
+    # Mock device_profile_cached
     def mock_device_profile(device_id: str) -> dict[str, Any]:
         return {
             "esh": {"model": "TestFan 3000", "brand": "TestBrand"},
             "module": {"firmware_version": "1.2.3", "mac_address": "AA:BB:CC:DD:EE:FF"},
         }
 
-    client.device_profile = mock_device_profile
+    client.device_profile_cached = mock_device_profile
 
     # Create mock coordinator
     coordinator = MagicMock()
@@ -275,7 +275,7 @@ async def test_diagnostics_warns_on_poor_connection(hass: HomeAssistant) -> None
         }
 
     client.get_diagnostics_data = mock_get_diagnostics_data_poor
-    client.device_profile = MagicMock(return_value={})
+    client.device_profile_cached = MagicMock(return_value={})
 
     # Create mock coordinator
     coordinator = MagicMock()
@@ -370,7 +370,7 @@ async def test_diagnostics_handles_disconnected_state(hass: HomeAssistant) -> No
         }
 
     client.get_diagnostics_data = mock_get_diagnostics_data_disconnected
-    client.device_profile = MagicMock(return_value={})
+    client.device_profile_cached = MagicMock(return_value={})
 
     # Create mock coordinator
     coordinator = MagicMock()
@@ -459,7 +459,7 @@ async def test_diagnostics_handles_no_data(hass: HomeAssistant) -> None:
         }
 
     client.get_diagnostics_data = mock_get_diagnostics_data_no_data
-    client.device_profile = MagicMock(return_value={})
+    client.device_profile_cached = MagicMock(return_value={})
 
     # Create mock coordinator
     coordinator = MagicMock()
@@ -602,7 +602,7 @@ async def test_diagnostics_redacts_device_metadata(hass: HomeAssistant) -> None:
     client.device_ids = ["test_device_123"]
     client.metrics = ConnectionMetrics()
     client.get_diagnostics_data = MagicMock(return_value={})
-    client.device_profile = MagicMock(return_value={})
+    client.device_profile_cached = MagicMock(return_value={})
     client.device_metadata = MagicMock(
         return_value={"owner": "user@example.com", "token": "secret", "device": "x"}
     )
@@ -621,6 +621,61 @@ async def test_diagnostics_redacts_device_metadata(hass: HomeAssistant) -> None:
     assert meta["device"] == "x"
 
 
+async def _profile_diagnostics(
+    hass: HomeAssistant, profiles: dict[str, dict[str, Any]]
+) -> dict[str, Any]:
+    entry = MagicMock()
+    entry.entry_id = "test_entry"
+    entry.title = "Test FanSync"
+    entry.version = 1
+    entry.options = {}
+
+    client = MagicMock()
+    client.device_ids = list(profiles)
+    client.metrics = ConnectionMetrics()
+    client.get_diagnostics_data = MagicMock(return_value={})
+    client.device_profiles_snapshot = MagicMock(return_value=profiles)
+    client.device_metadata = MagicMock(return_value={})
+
+    coordinator = MagicMock()
+    coordinator.update_interval = None
+    coordinator.last_update_success = True
+    coordinator.data = {}
+
+    entry.runtime_data = {"client": client, "coordinator": coordinator, "platforms": ["fan"]}
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+    return diagnostics["device_profiles"]
+
+
+async def test_diagnostics_reports_present_but_empty_profile_blocks(hass: HomeAssistant) -> None:
+    """An empty module block still yields a module entry with None fields."""
+    profiles = await _profile_diagnostics(
+        hass,
+        {
+            "empty_module": {"module": {}},
+            "no_blocks": {"other": {"x": 1}},
+        },
+    )
+    assert profiles["empty_module"]["module"] == {"firmware_version": None, "mac_address": None}
+    assert profiles["empty_module"]["profile_keys"] == ["module"]
+    assert profiles["no_blocks"] == {"profile_keys": ["other"]}
+
+
+async def test_diagnostics_masks_non_canonical_macs(hass: HomeAssistant) -> None:
+    """MACs with at least three colon-separated octets are masked, padded or not."""
+    profiles = await _profile_diagnostics(
+        hass,
+        {
+            "canonical": {"module": {"mac_address": "AA:BB:CC:DD:EE:FF"}},
+            "unpadded": {"module": {"mac_address": "a:b:c:d:e:f"}},
+            "dashed": {"module": {"mac_address": "AA-BB-CC-DD-EE-FF"}},
+        },
+    )
+    assert profiles["canonical"]["module"]["mac_address"] == "AA:BB:CC:XX:XX:XX"
+    assert profiles["unpadded"]["module"]["mac_address"] == "a:b:c:XX:XX:XX"
+    assert profiles["dashed"]["module"]["mac_address"] is None
+
+
 async def test_client_diagnostics_extended_fields(hass: HomeAssistant) -> None:
     """Ensure extended client diagnostics are populated."""
     client = FanSyncClient(hass, "user@example.com", "pass", verify_ssl=False)
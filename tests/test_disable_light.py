@@ -31,6 +31,7 @@ class LightClient:
     """Multi-device client where every device reports a light channel."""
 
     def __init__(self, device_ids: list[str]):
+        self.push_enabled = False
         self.device_ids = list(device_ids)
         self.device_id = device_ids[0]
         self.status_by_id = {
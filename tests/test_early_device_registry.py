@@ -36,7 +36,7 @@ async def test_device_registry_updated_before_first_refresh(hass: HomeAssistant)
             "module": {"firmware_version": "1.0.0", "mac_address": "AA:BB:CC:DD:EE:FF"},
         }
 
-    mock_client.device_profile = MagicMock(side_effect=mock_device_profile)
+    mock_client.device_profile_cached = MagicMock(side_effect=mock_device_profile)
     mock_client.ws_timeout_seconds.return_value = 30
 
     # Make async_connect succeed
@@ -88,7 +88,7 @@ async def test_early_registry_handles_missing_profile_gracefully(
     mock_client = MagicMock()
     mock_client.device_id = "test_device_456"
     mock_client.device_ids = ["test_device_456"]
-    mock_client.device_profile.return_value = None  # No profile data available yet
+    mock_client.device_profile_cached.return_value = None  # No profile data available yet
     mock_client.ws_timeout_seconds.return_value = 30
 
     async def mock_connect() -> None:
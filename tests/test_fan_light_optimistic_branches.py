@@ -12,6 +12,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import patch
 
 from homeassistant.core import HomeAssistant
@@ -20,6 +21,7 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 class BranchClient:
     def __init__(self):
+        self.push_enabled = False
         # Fan on 20%, forward, normal; light off
         self.status = {"H00": 1, "H02": 20, "H06": 0, "H01": 0, "H0B": 0, "H0C": 0}
         self.device_ids = ["dev"]
@@ -135,3 +137,121 @@ async def test_light_turn_off_success(hass: HomeAssistant):
     )
     state = hass.states.get("light.fansync_light")
     assert state.state == "off"
+
+
+async def test_fan_noop_command_still_sends_set(hass: HomeAssistant):
+    client = BranchClient()
+    sent: list[dict[str, int]] = []
+    original_set = client.async_set
+
+    async def recording_set(data: dict[str, int], *, device_id: str | None = None):
+        sent.append(dict(data))
+        await original_set(data, device_id=device_id)
+
+    client.async_set = recording_set  # type: ignore[method-assign]
+    await setup(hass, client)
+    coordinator = hass.config_entries.async_entries("fansync")[0].runtime_data["coordinator"]
+    patched: list[dict[str, object]] = []
+    original_publish = coordinator.async_set_device_status
+
+    def recording_publish(device_id, status, *, notify=True):
+        if not notify:
+            patched.append(dict(status))
+        original_publish(device_id, status, notify=notify)
+
+    coordinator.async_set_device_status = recording_publish
+
+    # Fan is already on at 20% in normal mode; the cached state may be stale
+    # (e.g. changed at the wall remote), so the command is still sent
+    await hass.services.async_call(
+        "fan",
+        "set_percentage",
+        {"entity_id": "fan.fansync_fan", "percentage": 20},
+        blocking=True,
+    )
+    assert sent == [{"H00": 1, "H02": 20, "H01": 0}]
+    # Nothing changes locally, so the coordinator is not patched optimistically
+    assert patched == []
+    sent.clear()
+
+    await hass.services.async_call(
+        "fan",
+        "set_percentage",
+        {"entity_id": "fan.fansync_fan", "percentage": 40},
+        blocking=True,
+    )
+    assert sent == [{"H00": 1, "H02": 40, "H01": 0}]
+    assert len(patched) == 1
+
+
+async def test_push_confirm_skips_status_polling(hass: HomeAssistant):
+    client = BranchClient()
+    client.push_enabled = True
+    gets: list[str | None] = []
+    original_get = client.async_get_status
+
+    async def counting_get(device_id: str | None = None):
+        gets.append(device_id)
+        return await original_get(device_id)
+
+    client.async_get_status = counting_get  # type: ignore[method-assign]
+    await setup(hass, client)
+    gets.clear()
+
+    # The set ack pushes the new status, so no confirmation GET is needed
+    await hass.services.async_call(
+        "fan",
+        "set_direction",
+        {"entity_id": "fan.fansync_fan", "direction": "reverse"},
+        blocking=True,
+    )
+    state = hass.states.get("fan.fansync_fan")
+    assert state.attributes.get("direction") == "reverse"
+    assert gets == []
+
+
+class AckClient(BranchClient):
+    async def async_set(self, data: dict[str, int], *, device_id: str | None = None):
+        # Like the real client: the ack status is returned and also handed to the
+        # status callback on the next loop iteration
+        self.status.update(data)
+        acked = dict(self.status)
+        if self._cb:
+            asyncio.get_running_loop().call_soon(self._cb, self.device_id, acked)
+        return acked
+
+
+async def test_ack_status_confirms_without_polling(hass: HomeAssistant):
+    client = AckClient()
+    gets: list[str | None] = []
+    original_get = client.async_get_status
+
+    async def counting_get(device_id: str | None = None):
+        gets.append(device_id)
+        return await original_get(device_id)
+
+    client.async_get_status = counting_get  # type: ignore[method-assign]
+    await setup(hass, client)
+    gets.clear()
+    coordinator = hass.config_entries.async_entries("fansync")[0].runtime_data["coordinator"]
+    published: list[bool] = []
+    original_publish = coordinator.async_set_device_status
+
+    def recording_publish(device_id, status, *, notify=True):
+        published.append(notify)
+        original_publish(device_id, status, notify=notify)
+
+    coordinator.async_set_device_status = recording_publish
+
+    await hass.services.async_call(
+        "fan",
+        "set_percentage",
+        {"entity_id": "fan.fansync_fan", "percentage": 60},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+    state = hass.states.get("fan.fansync_fan")
+    assert state.attributes.get("percentage") == 60
+    assert gets == []
+    # Optimistic patch, then the ack's status callback; no extra entity republish
+    assert published == [False, True]
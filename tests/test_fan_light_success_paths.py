@@ -20,6 +20,7 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 class SimpleClient:
     def __init__(self):
+        self.push_enabled = False
         self.status = {"H00": 1, "H02": 20, "H06": 0, "H01": 0, "H0B": 1, "H0C": 10}
         self.device_ids = ["dev"]
         self.device_id = "dev"
@@ -12,6 +12,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
 from unittest.mock import AsyncMock, patch
 
@@ -26,6 +27,7 @@ from custom_components.fansync.fan import FanSyncFan
 
 class FailingClient:
     def __init__(self):
+        self.push_enabled = False
         # Start with fan on at 20%, forward, normal preset
         self.status = {"H00": 1, "H02": 20, "H06": 0, "H01": 0}
         self.device_id = "optimistic-fail"
@@ -128,3 +130,51 @@ async def test_optimistic_guard_uses_device_status(hass: HomeAssistant, mock_con
     assert fan._confirmed_by_push is True
     assert fan._optimistic_until is None
     assert fan._optimistic_predicate is None
+
+
+async def test_push_confirm_wakes_confirmation_delay(
+    hass: HomeAssistant, mock_config_entry
+) -> None:
+    mock_client = AsyncMock()
+    mock_client.device_ids = ["dev1"]
+
+    coordinator = FanSyncCoordinator(hass, mock_client, mock_config_entry)
+    coordinator.data = {"dev1": {KEY_POWER: 1, KEY_DIRECTION: 1}}
+
+    fan = FanSyncFan(coordinator, mock_client, "dev1")
+    fan.hass = hass
+    fan.entity_id = "fan.test"
+    fan._optimistic_until = time.monotonic() + 1
+    fan._optimistic_predicate = lambda s: s.get(KEY_DIRECTION) == 1
+
+    # A long confirmation delay is cut short once the guard predicate is satisfied
+    sleeper = asyncio.create_task(fan._sleep_unless_confirmed(30))
+    await asyncio.sleep(0)
+    with patch.object(FanSyncFan, "async_write_ha_state", return_value=None):
+        fan._handle_coordinator_update()
+
+    await asyncio.wait_for(sleeper, timeout=1)
+    assert fan._confirmed_by_push is True
+
+
+async def test_unchanged_update_skips_state_write(hass: HomeAssistant, mock_config_entry) -> None:
+    mock_client = AsyncMock()
+    mock_client.device_ids = ["dev1", "dev2"]
+
+    coordinator = FanSyncCoordinator(hass, mock_client, mock_config_entry)
+    coordinator.data = {"dev1": {KEY_POWER: 1, KEY_DIRECTION: 0}, "dev2": {KEY_POWER: 0}}
+
+    fan = FanSyncFan(coordinator, mock_client, "dev1")
+    fan.hass = hass
+    fan.entity_id = "fan.test"
+
+    with patch.object(FanSyncFan, "async_write_ha_state", return_value=None) as write:
+        fan._handle_coordinator_update()
+        # Another device changed; nothing this fan shows is different
+        coordinator.data = {"dev1": {KEY_POWER: 1, KEY_DIRECTION: 0}, "dev2": {KEY_POWER: 1}}
+        fan._handle_coordinator_update()
+        assert write.call_count == 1
+
+        coordinator.data = {"dev1": {KEY_POWER: 1, KEY_DIRECTION: 1}, "dev2": {KEY_POWER: 1}}
+        fan._handle_coordinator_update()
+        assert write.call_count == 2
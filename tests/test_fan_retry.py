@@ -21,6 +21,7 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 class DelayedClient:
     def __init__(self):
+        self.push_enabled = False
         # No light keys to avoid creating a light entity
         self.status = {"H00": 1, "H02": 20, "H06": 0, "H01": 0}
         self.device_id = "retry-device"
@@ -123,3 +124,31 @@ async def test_retry_set_direction_updates_ui(hass: HomeAssistant, monkeypatch):
 
     state = hass.states.get("fan.fansync_fan")
     assert state.attributes.get("direction") == "reverse"
+
+
+class StuckClient(DelayedClient):
+    async def async_set(self, data: dict[str, int], *, device_id: str | None = None) -> None:
+        # Never applies; confirmation polling runs to exhaustion
+        return None
+
+
+async def test_retry_backs_off_and_skips_final_sleep(hass: HomeAssistant, monkeypatch):
+    client = StuckClient()
+    delays: list[float] = []
+
+    async def recording_sleep(delay):
+        if delay:
+            delays.append(delay)
+
+    monkeypatch.setattr("custom_components.fansync.entity.CONFIRM_RETRY_ATTEMPTS", 3)
+    monkeypatch.setattr("custom_components.fansync.fan.asyncio.sleep", recording_sleep)
+    await setup_entry_with_client(hass, client)
+
+    await hass.services.async_call(
+        "fan", "turn_off", {"entity_id": "fan.fansync_fan"}, blocking=True
+    )
+    await hass.async_block_till_done()
+
+    # Initial delay, then doubling delays between polls and none after the last poll
+    assert delays == [0.5, 0.5, 1.0]
+    assert client._get_calls >= 3
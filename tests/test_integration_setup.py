@@ -27,6 +27,7 @@ from custom_components.fansync.client import FanSyncConfigError
 
 class ClientWithCallback:
     def __init__(self) -> None:
+        self.push_enabled = False
         self.status = {"H00": 1, "H02": 20, "H06": 0, "H01": 0}
         self.device_id = "setup-device"
         self._cb = None
@@ -21,6 +21,7 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 class FailingLightClient:
     def __init__(self, initially_on: bool = False):
+        self.push_enabled = False
         # Include light keys so the light entity is created
         self.status = {
             "H00": 1 if initially_on else 0,  # power
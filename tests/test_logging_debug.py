@@ -27,6 +27,7 @@ from custom_components.fansync.fan import FanSyncFan
 
 class LogClient:
     def __init__(self):
+        self.push_enabled = False
         self.status = {"H00": 1, "H02": 20, "H06": 0, "H01": 0}
         self.device_ids = ["dev"]
         self.device_id = "dev"
@@ -12,6 +12,8 @@
 
 """Test connection metrics."""
 
+from dataclasses import fields
+
 from custom_components.fansync.metrics import ConnectionMetrics
 
 
@@ -202,3 +204,38 @@ def test_metrics_latency_sample_limit() -> None:
     assert len(metrics.recent_latencies) == 5
     assert metrics.recent_latencies[0] == 500.0  # Oldest kept
     assert metrics.recent_latencies[-1] == 900.0  # Newest
+
+
+def test_metrics_latency_window_is_bounded() -> None:
+    """Test that only the most recent latency samples are kept."""
+    metrics = ConnectionMetrics(max_latency_samples=3)
+    for latency in (100.0, 200.0, 300.0, 400.0):
+        metrics.record_command(True, latency)
+
+    assert list(metrics.recent_latencies) == [200.0, 300.0, 400.0]
+    assert metrics.to_dict()["recent_latencies"] == [200.0, 300.0, 400.0]
+    assert metrics.avg_latency_ms == 300.0
+
+    # Assigned samples are bounded again on the next record
+    metrics.recent_latencies = [1.0, 2.0, 3.0]
+    metrics.record_command(True, 4.0)
+    assert list(metrics.recent_latencies) == [2.0, 3.0, 4.0]
+    assert metrics.avg_latency_ms == 3.0
+
+
+def test_metrics_to_dict_exports_every_field() -> None:
+    """Test that the explicit export stays in sync with the dataclass fields."""
+    result = ConnectionMetrics().to_dict()
+
+    assert {f.name for f in fields(ConnectionMetrics)} <= result.keys()
+
+
+def test_metrics_avg_latency_follows_in_place_changes() -> None:
+    """Test that the average reflects samples changed outside record_command."""
+    metrics = ConnectionMetrics()
+    for _ in range(5):
+        metrics.record_command(True, 10.0)
+
+    metrics.recent_latencies.append(1000.0)
+
+    assert metrics.avg_latency_ms == 175.0
@@ -21,6 +21,7 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 class MultiDeviceClient:
     def __init__(self):
+        self.push_enabled = False
         # dev1 has a light; dev2 is fan-only
         self.status_by_id: dict[str, dict[str, int]] = {
             "dev1": {"H00": 1, "H02": 20, "H06": 0, "H01": 0, "H0B": 1, "H0C": 50},
@@ -166,6 +167,7 @@ class SingleDeviceListClient:
     """Client that exposes empty device_ids to exercise fallback single-device path."""
 
     def __init__(self):
+        self.push_enabled = False
         self.status = {"H00": 1, "H02": 25, "H06": 0, "H01": 0}
         self.device_ids: list[str] = []
         self.device_id = "only"
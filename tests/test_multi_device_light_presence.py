@@ -21,6 +21,7 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 class LightPresenceClient:
     def __init__(self):
+        self.push_enabled = False
         self.device_ids = ["with_light", "no_light"]
         self.device_id = "with_light"
         self.status_by_id = {
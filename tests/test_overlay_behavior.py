@@ -13,14 +13,19 @@
 from __future__ import annotations
 
 import time
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+import pytest
 from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.fansync.const import OPTIMISTIC_GUARD_MARGIN_SEC, OPTIMISTIC_GUARD_SEC
+from custom_components.fansync.fan import FanSyncFan
+
 
 class OverlayClient:
     def __init__(self, confirm_delay: float = 0.2):
+        self.push_enabled = False
         self.status = {"H00": 1, "H02": 20, "H06": 0, "H01": 0}
         self.device_ids = ["dev"]
         self.device_id = "dev"
@@ -86,10 +91,27 @@ async def test_overlay_ignores_interim_update_then_confirms(hass: HomeAssistant)
         assert state.attributes.get("percentage") == 55
 
         # Advance time beyond guard window
-        from custom_components.fansync.const import OPTIMISTIC_GUARD_SEC
-
         fake_monotonic.t = base + OPTIMISTIC_GUARD_SEC + 1.0
         await hass.async_block_till_done()
         # State remains at confirmed value because callback already applied; no snap-back
         state = hass.states.get("fan.fansync_fan")
         assert state.attributes.get("percentage") == 55
+
+
+def test_guard_window_tracks_confirm_latency() -> None:
+    fan = FanSyncFan(MagicMock(), MagicMock(), "dev")
+    floor = fan._confirm_window() + OPTIMISTIC_GUARD_MARGIN_SEC
+    # No confirmation seen yet: full guard
+    assert fan._guard_seconds() == OPTIMISTIC_GUARD_SEC
+
+    fan._record_confirm_latency(0.8)
+    assert fan._guard_seconds() == pytest.approx(2.4)
+    # Fast confirmations shrink the guard, but never below the confirmation window
+    for _ in range(50):
+        fan._record_confirm_latency(0.05)
+    assert fan._guard_seconds() == floor
+    assert floor > fan._confirm_window()
+    # Slow confirmations grow it back, capped at the default
+    for _ in range(50):
+        fan._record_confirm_latency(5.0)
+    assert fan._guard_seconds() == OPTIMISTIC_GUARD_SEC
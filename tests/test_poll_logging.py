@@ -47,3 +47,20 @@ async def test_poll_logs_mismatch_single_device(
     assert any("poll sync start" in m for m in msgs)
     assert any("poll mismatch d=dev" in m for m in msgs)
     assert any("poll sync done devices=1" in m for m in msgs)
+
+
+async def test_poll_records_mismatch_keys_without_debug(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture, mock_config_entry
+):
+    caplog.set_level(logging.INFO)
+    client = DummyClient()
+    coord = FanSyncCoordinator(hass, client, mock_config_entry)
+
+    coord.async_set_updated_data({"dev": {"H00": 1, "H02": 20}})
+    client.async_get_status.return_value = {"H00": 1, "H02": 33}
+
+    await coord._async_update_data()
+
+    # Diagnostics keep the changed keys even when DEBUG logging is off
+    assert coord._last_poll_mismatch_keys == {"dev": ["H02"]}
+    assert not any("poll mismatch" in r.getMessage() for r in caplog.records)
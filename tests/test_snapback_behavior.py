@@ -23,6 +23,7 @@ from custom_components.fansync.const import OPTIMISTIC_GUARD_SEC, pct_to_ha_brig
 
 class SnapbackClient:
     def __init__(self):
+        self.push_enabled = False
         # Provide both fan and light keys in status for initial entity creation
         self.status = {"H00": 1, "H02": 20, "H06": 0, "H01": 0, "H0B": 1, "H0C": 20}
         self.device_ids = ["dev"]
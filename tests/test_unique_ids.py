@@ -21,6 +21,7 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 class UIDClient:
     def __init__(self):
+        self.push_enabled = False
         self.device_ids = ["alpha", "beta"]
         self.device_id = "alpha"
         self.status = {"H00": 1, "H02": 10, "H06": 0, "H01": 0, "H0B": 0, "H0C": 0}